@@ -8,10 +8,8 @@ initializes the components.
 import os
 import sys
 import logging
-from PyQt6.QtWidgets import QApplication
-from src.gui.main_window import MainWindow
 from src.utils.logging import setup_logging
-from src.config import APP_DIR
+from src.config import ensure_app_dir
 
 def main():
     """Main function to start the application."""
@@ -23,16 +21,27 @@ def main():
     
     try:
         # Ensure application directory exists
-        APP_DIR.mkdir(parents=True, exist_ok=True)
+        ensure_app_dir()
         
         # Start GUI application
+        # Qt and the GUI modules are imported here so that their import cost
+        # is only paid once the window is actually about to be shown
         logger.info("Starting GUI application...")
+        from PyQt6.QtWidgets import QApplication
         app = QApplication(sys.argv)
+
+        from src.gui.main_window import MainWindow
         window = MainWindow()
         window.show()
         
         logger.info("Application ready")
-        sys.exit(app.exec())
+        exit_code = app.exec()
+
+        # Background CSV readers emit their results through Qt signals, so
+        # they have to finish before Qt and Python tear their objects down
+        from PyQt6.QtCore import QThreadPool
+        QThreadPool.globalInstance().waitForDone()
+        sys.exit(exit_code)
         
     except Exception as e:
         logger.exception("Unhandled exception occurred")
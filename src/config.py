@@ -1,10 +1,31 @@
 """Central application configuration."""
+import json
+import sys
+from functools import cache
+from importlib.resources import files
 from pathlib import Path
-from typing import Final, List, Dict, Any
+from types import MappingProxyType
+from typing import Final, List, Dict, Any, Mapping
+
+
+def _frozen_strings(values: Dict[str, str]) -> Mapping[str, str]:
+    """Return a read-only view of a string mapping with interned keys and values."""
+    return MappingProxyType({sys.intern(key): sys.intern(value) for key, value in values.items()})
+
 
 # Application data directory (for logs, config, etc.)
 APP_DIR: Final[Path] = Path.home() / ".datainspect"
-APP_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def ensure_app_dir() -> Path:
+    """Create the application data directory if it does not exist yet.
+
+    Returns:
+        The application data directory
+    """
+    APP_DIR.mkdir(parents=True, exist_ok=True)
+    return APP_DIR
+
 
 # UI settings
 WINDOW_MIN_WIDTH: Final[int] = 800
@@ -17,7 +38,7 @@ LEFT_PANEL_WIDTH: Final[int] = 280
 RIGHT_PANEL_WIDTH: Final[int] = 300  # Width for properties panel
 
 # UI colors
-UI_COLORS: Final[Dict[str, str]] = {
+UI_COLORS: Final[Mapping[str, str]] = _frozen_strings({
     # Base colors
     'background': '#1e1e1e',
     'background_light': '#252525',
@@ -41,7 +62,7 @@ UI_COLORS: Final[Dict[str, str]] = {
     'tab_active': '#4a86e8',
     'tab_inactive': '#3d3d3d',
     'selection': '#3a3a3a',
-}
+})
 
 # Data import settings
 SUPPORTED_FORMATS: Final[List[str]] = ['.csv', '.xlsx', '.json']
@@ -49,77 +70,33 @@ MAX_FILE_SIZE: Final[int] = 100 * 1024 * 1024  # 100 MB
 
 # Project file settings
 PROJECT_FILE_EXTENSION: Final[str] = '.dinsp'
+PROJECT_FORMAT_VERSION: Final[int] = 2  # Older files may still use the legacy layout
+
+# Visualization types and colors (loaded from src/resources/visualizations.json)
+@cache
+def _visualization_resource() -> Dict[str, Any]:
+    """Read the bundled visualization definitions once."""
+    return json.loads((files(__package__) / 'resources' / 'visualizations.json').read_bytes())
+
+
+@cache
+def visualization_types() -> Mapping[str, Mapping[str, Any]]:
+    """Return the available visualization types.
+
+    Returns:
+        Read-only mapping of chart type to its name, icon, description and
+        whether it supports multiple y-axes
+    """
+    types = _visualization_resource()['types']
+    return MappingProxyType({key: MappingProxyType(info) for key, info in types.items()})
+
 
-# Visualization types
-VISUALIZATION_TYPES: Final[Dict[str, Dict[str, Any]]] = {
-    'bar': {
-        'name': 'Balkendiagramm',
-        'icon': '📊',
-        'description': 'Vergleicht Werte über verschiedene Kategorien',
-        'supports_multiple_y': True
-    },
-    'line': {
-        'name': 'Liniendiagramm',
-        'icon': '📈',
-        'description': 'Zeigt Trends über einen Zeitraum oder eine Sequenz',
-        'supports_multiple_y': True
-    },
-    'pie': {
-        'name': 'Kreisdiagramm',
-        'icon': '🥧',
-        'description': 'Zeigt Anteile am Gesamtwert',
-        'supports_multiple_y': False
-    },
-    'scatter': {
-        'name': 'Streudiagramm',
-        'icon': '🔵',
-        'description': 'Zeigt Beziehungen zwischen zwei Variablen',
-        'supports_multiple_y': False
-    },
-    'heatmap': {
-        'name': 'Heatmap',
-        'icon': '🔥',
-        'description': 'Visualisiert Daten als farbige Matrix',
-        'supports_multiple_y': False
-    }
-}
-
-# Visualization colors
-VISUALIZATION_COLORS: Final[Dict[str, Dict[str, str]]] = {
-    'Grau': {
-        'hell': '#CCCCCC',
-        'mittel': '#999999',
-        'dunkel': '#666666'
-    },
-    'Blau': {
-        'hell': '#A4C2F4',
-        'mittel': '#6D9EEB',
-        'dunkel': '#3D78D6'
-    },
-    'Rot': {
-        'hell': '#F4CCCC',
-        'mittel': '#EA9999',
-        'dunkel': '#E06666'
-    },
-    'Grün': {
-        'hell': '#D9EAD3',
-        'mittel': '#B6D7A8',
-        'dunkel': '#93C47D'
-    },
-    'Gelb': {
-        'hell': '#FFF2CC',
-        'mittel': '#FFE599',
-        'dunkel': '#FFD966'
-    },
-    'Orange': {
-        'hell': '#FCE5CD',
-        'mittel': '#F9CB9C',
-        'dunkel': '#F6B26B'
-    },
-    'Lila': {
-        'hell': '#D9D2E9',
-        'mittel': '#B4A7D6',
-        'dunkel': '#8E7CC3'
-    }
-}
+@cache
+def visualization_colors() -> Mapping[str, Mapping[str, str]]:
+    """Return the visualization color palette.
 
+    Returns:
+        Read-only mapping of color group to its 'hell', 'mittel' and 'dunkel' shades
+    """
+    colors = _visualization_resource()['colors']
+    return MappingProxyType({key: _frozen_strings(shades) for key, shades in colors.items()})
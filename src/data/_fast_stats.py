@@ -0,0 +1,101 @@
+"""Column statistics for blocks of same-typed numeric columns.
+
+Blocks are processed column-major, one contiguous row per column, with
+vectorized NumPy reductions.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict
+import numpy as np
+
+
+def _float_stats(columns: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-column count, mean and squared deviations of a float block."""
+    mask = np.isnan(columns)
+    count = columns.shape[1] - mask.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(mask, 0.0, columns).sum(axis=1) / count
+    m2 = np.where(mask, 0.0, np.square(columns - mean[:, None])).sum(axis=1)
+    return {'count': count, 'mean': mean, 'm2': m2}
+
+
+def _int_stats(columns: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-column count, mean and squared deviations of an integer block."""
+    n_cols, n_rows = columns.shape
+    mean = columns.sum(axis=1, dtype=np.float64) / n_rows
+    return {
+        'count': np.full(n_cols, n_rows),
+        'mean': mean,
+        'm2': np.square(columns - mean[:, None]).sum(axis=1),
+    }
+
+
+# Minimum number of columns per thread when sorting a block in parallel
+PARALLEL_MIN_COLUMNS = 8
+
+
+def _sorted_columns(columns: np.ndarray) -> np.ndarray:
+    """Sort each row of a column-major block, split across threads if worthwhile.
+
+    NumPy releases the GIL while sorting, so chunks of columns sort in parallel.
+    """
+    workers = min(os.cpu_count() or 1, columns.shape[0] // PARALLEL_MIN_COLUMNS)
+    if workers < 2:
+        return np.sort(columns, axis=1)
+
+    ordered = columns.copy()
+    bounds = np.linspace(0, columns.shape[0], workers + 1).astype(int)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        _ = list(executor.map(lambda start, stop: ordered[start:stop].sort(axis=1),
+                              bounds[:-1], bounds[1:]))
+    return ordered
+
+
+def block_stats(arr2d: np.ndarray) -> Dict[str, np.ndarray]:
+    """Calculate column statistics for a 2-D block of one numeric dtype.
+
+    Args:
+        arr2d: Non-empty array of shape (rows, columns) with an int, uint or
+            float dtype
+
+    Returns:
+        Arrays with one entry per column for 'count', 'null_count',
+        'unique_count', 'min', 'max', 'mean', 'median' and 'std'. Entries of
+        columns without values (and 'std' of columns with a single value)
+        are NaN.
+    """
+    columns = np.ascontiguousarray(arr2d.T)
+    if columns.dtype.kind == 'f':
+        stats = _float_stats(columns.astype(np.float64, copy=False))
+    else:
+        stats = _int_stats(columns)
+
+    count = stats['count']
+    stats['null_count'] = columns.shape[1] - count
+    with np.errstate(invalid='ignore', divide='ignore'):
+        stats['std'] = np.where(count > 1, np.sqrt(stats.pop('m2') / (count - 1)), np.nan)
+
+    # One sort per column yields min, max, median and the number of distinct
+    # values; NaNs sort to the end and are cut off by the count
+    ordered = _sorted_columns(columns)
+    n_cols = columns.shape[0]
+    minimum = np.full(n_cols, np.nan, dtype=object)
+    maximum = np.full(n_cols, np.nan, dtype=object)
+    median = np.full(n_cols, np.nan)
+    unique_count = np.zeros(n_cols, dtype=np.int64)
+    for j in np.flatnonzero(count):
+        values = ordered[j, :count[j]]
+        middle = len(values) // 2
+        minimum[j] = values[0]
+        maximum[j] = values[-1]
+        if len(values) % 2:
+            median[j] = values[middle]
+        else:
+            median[j] = values[middle - 1:middle + 1].mean()
+        unique_count[j] = 1 + np.count_nonzero(values[1:] != values[:-1])
+
+    stats['min'] = minimum
+    stats['max'] = maximum
+    stats['median'] = median
+    stats['unique_count'] = unique_count
+    return stats
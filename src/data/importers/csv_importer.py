@@ -1,7 +1,11 @@
 """CSV data importer for DataInspect application."""
+import csv
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -9,9 +13,111 @@ from src.data.models import DataSource, Dataset
 
 logger = logging.getLogger(__name__)
 
+# Previews that already contain the whole file, keyed like _read_preview without
+# the row count, so a following full import can skip parsing the file again.
+# Least recently used entries are dropped first; larger previews are not kept.
+_COMPLETE_PREVIEWS: 'OrderedDict[Tuple[Any, ...], pd.DataFrame]' = OrderedDict()
+_COMPLETE_PREVIEWS_MAX = 8
+_COMPLETE_PREVIEW_MAX_ROWS = 10_000
+
+
+def _file_version(file_path: Path) -> Tuple[int, int]:
+    """Modification time and size of a file, identifying its current contents in cache keys."""
+    stat = file_path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _remember_complete_preview(key: Tuple[Any, ...], df: pd.DataFrame) -> None:
+    """Keep a preview that covers the whole file, replacing older versions of the file."""
+    for stale in [k for k in _COMPLETE_PREVIEWS if k[0] == key[0] and k[1] != key[1]]:
+        del _COMPLETE_PREVIEWS[stale]
+    _COMPLETE_PREVIEWS[key] = df
+    _COMPLETE_PREVIEWS.move_to_end(key)
+    while len(_COMPLETE_PREVIEWS) > _COMPLETE_PREVIEWS_MAX:
+        _ = _COMPLETE_PREVIEWS.popitem(last=False)
+
+
+def _take_complete_preview(key: Tuple[Any, ...]) -> Optional[pd.DataFrame]:
+    """Return a remembered whole-file preview for the key, if any."""
+    df = _COMPLETE_PREVIEWS.get(key)
+    if df is not None:
+        _COMPLETE_PREVIEWS.move_to_end(key)
+    return df
+
+
+@lru_cache(maxsize=32)
+def _read_preview(
+    file_path: Path,
+    version: Tuple[int, int],
+    delimiter: str,
+    encoding: str,
+    has_header: bool,
+    skip_rows: int,
+    preview_rows: int,
+    decimal: str = '.',
+    thousands: Optional[str] = None
+) -> pd.DataFrame:
+    """Read the first rows of a CSV file, memoized per file version and options.
+
+    The file version (see _file_version) is only part of the cache key, so a
+    changed file is read again while toggling options back and forth is served
+    from the cache.
+    Callers must not modify the returned DataFrame.
+    """
+    df = pd.read_csv(
+        file_path,
+        delimiter=delimiter,
+        encoding=encoding,
+        header=0 if has_header else None,
+        skiprows=skip_rows,
+        decimal=decimal,
+        thousands=thousands,
+        nrows=preview_rows
+    )
+
+    # If no header, rename columns to more user-friendly format
+    if not has_header:
+        df.columns = [f"Spalte_{i+1}" for i in range(len(df.columns))]
+
+    # Fewer rows than requested means the end of the file was reached
+    if len(df) < preview_rows and len(df) <= _COMPLETE_PREVIEW_MAX_ROWS:
+        _remember_complete_preview(
+            (file_path, version, delimiter, encoding, has_header, skip_rows, decimal, thousands), df
+        )
+
+    return df
+
+
+@lru_cache(maxsize=32)
+def _detect_delimiter(file_path: Path, version: Tuple[int, int], encoding: str) -> str:
+    """Sniff the delimiter of a CSV file, memoized per file version and encoding.
+
+    Like in _read_preview, the file version is only part of the cache key.
+    """
+    # Sniff a bounded sample, decoded once and cut at the last complete line
+    with open(file_path, 'rb') as f:
+        raw = f.read(CSVImporter.SNIFF_SAMPLE_BYTES)
+    sample = raw.decode(encoding, errors='replace')
+    last_newline = sample.rfind('\n')
+    if last_newline > 0:
+        sample = sample[:last_newline + 1]
+
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=CSVImporter.DELIMITER_CANDIDATES).delimiter
+    except csv.Error:
+        # Inconsistent rows: fall back to the most frequent candidate,
+        # counted in a single vectorized pass over the raw bytes
+        counts = np.bincount(np.frombuffer(raw, dtype=np.uint8), minlength=256)
+        return max(CSVImporter.DELIMITER_CANDIDATES, key=lambda d: counts[ord(d)])
+
+
 class CSVImporter:
     """Handles importing CSV files into the application."""
 
+    # Delimiters considered by detect_delimiter and the size of the sample it reads
+    DELIMITER_CANDIDATES = ',;\t|'
+    SNIFF_SAMPLE_BYTES = 8192
+
     @staticmethod
     def import_file(
         file_path: Path,
@@ -57,6 +163,21 @@ class CSVImporter:
                 # Read the CSV file
                 if preview_only:
                     # For preview, read only a few rows
+                    _ = _read_preview(
+                        file_path, _file_version(file_path), delimiter, encoding,
+                        has_header, skip_rows, preview_rows, decimal, thousands or None
+                    )
+                    return None, None
+
+                # For actual import, reuse a preview that already covered the
+                # whole file, otherwise read the entire file
+                df = _take_complete_preview((
+                    file_path, _file_version(file_path), delimiter, encoding,
+                    has_header, skip_rows, decimal, thousands or None
+                ))
+                if df is not None:
+                    df = df.copy()
+                else:
                     df = pd.read_csv(
                         file_path,
                         delimiter=delimiter,
@@ -64,29 +185,20 @@ class CSVImporter:
                         header=header,
                         skiprows=skip_rows,
                         decimal=decimal,
-                        thousands=thousands,
-                        nrows=preview_rows
+                        thousands=thousands or None
                     )
-                    return None, None
-
-                # For actual import, read the entire file
-                df = pd.read_csv(
-                    file_path,
-                    delimiter=delimiter,
-                    encoding=encoding,
-                    header=header,
-                    skiprows=skip_rows,
-                    decimal=decimal,
-                    thousands=thousands
-                )
 
                 # If no header, rename columns to more user-friendly format
                 if not has_header:
                     df.columns = [f"Spalte_{i+1}" for i in range(len(df.columns))]
 
-            # Collect source information
+            # Collect metadata from the parsed frame together with the source
+            # information, so the Dataset does not need another pass over it
             now = datetime.now()
-            source_info = {
+            metadata = {
+                "rows": len(df),
+                "columns": len(df.columns),
+                "column_types": {col: str(dtype) for col, dtype in df.dtypes.items()},
                 "delimiter": delimiter,
                 "encoding": encoding,
                 "has_header": has_header,
@@ -99,17 +211,14 @@ class CSVImporter:
             # Use the provided name if available, otherwise use the file name
             source_name = name if name else file_path.name
 
-            # Create Dataset with empty metadata
+            # Create Dataset with the precomputed metadata
             dataset = Dataset(
                 data=df,
-                metadata={},
+                metadata=metadata,
                 created_at=now,
                 modified_at=now
             )
 
-            # Generate metadata with source information
-            dataset.generate_metadata(source_info)
-
             # Create DataSource with the Dataset
             data_source = DataSource(
                 name=source_name,
@@ -152,24 +261,13 @@ class CSVImporter:
             - Error message (None if successful)
         """
         try:
-            # Determine header row setting
-            header = 0 if has_header else None
-
-            # Read the CSV file
-            df = pd.read_csv(
-                file_path,
-                delimiter=delimiter,
-                encoding=encoding,
-                header=header,
-                skiprows=skip_rows,
-                nrows=preview_rows
+            # Read the CSV file (cached per file version and options); hand out
+            # a copy so callers cannot modify the cached preview
+            df = _read_preview(
+                file_path, _file_version(file_path), delimiter, encoding,
+                has_header, skip_rows, preview_rows
             )
-
-            # If no header, rename columns to more user-friendly format
-            if not has_header:
-                df.columns = [f"Spalte_{i+1}" for i in range(len(df.columns))]
-
-            return df, None
+            return df.copy(), None
 
         except Exception as e:
             error_msg = f"Error reading CSV file: {str(e)}"
@@ -188,28 +286,9 @@ class CSVImporter:
             Detected delimiter character (defaults to ',' if detection fails)
         """
         try:
-            # Read the first few lines of the file
-            with open(file_path, 'r', encoding=encoding) as f:
-                lines = [f.readline() for _ in range(3)]
-
-            # Count occurrences of common delimiters
-            delimiters = {',': 0, ';': 0, '\t': 0, '|': 0}
-
-            for line in lines:
-                for delimiter, count in delimiters.items():
-                    delimiters[delimiter] += line.count(delimiter)
-
-            # Find the delimiter with the most occurrences
-            max_count = 0
-            detected_delimiter = ','  # Default
-
-            for delimiter, count in delimiters.items():
-                if count > max_count:
-                    max_count = count
-                    detected_delimiter = delimiter
-
-            return detected_delimiter
-
+            # Detection is memoized per file version, so reopening the import
+            # dialog for the same file does not read or sniff it again
+            return _detect_delimiter(file_path, _file_version(file_path), encoding)
         except Exception as e:
             logger.warning(f"Error detecting delimiter for {file_path}: {str(e)}")
             return ','  # Default to comma if detection fails
@@ -1,63 +1,42 @@
 """Data models for the application."""
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, TypeVar, Iterable, override, SupportsIndex, Optional, List, Dict
+from functools import lru_cache
+from typing import Any, Callable, TypeVar, Iterable, SupportsIndex, Optional, List, Dict, override
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import uuid
 from ..utils.observer import Observable
+from ._fast_stats import block_stats
 
 
-T = TypeVar('T')
-
-
-class _TrackingList(list[T]):
-    """A list subclass that tracks modifications and calls a callback when modified."""
-
-    def __init__(self, initial_items: Iterable[T], callback: Callable[[], None]) -> None:
-        super().__init__(initial_items)
-        self._callback = callback
-
-    @override
-    def __setitem__(self, key: SupportsIndex | slice, value: Any) -> None:
-        super().__setitem__(key, value)
-        self._callback()
-
-    @override
-    def __delitem__(self, key: SupportsIndex | slice) -> None:
-        super().__delitem__(key)
-        self._callback()
-
-    @override
-    def append(self, item: T) -> None:
-        super().append(item)
-        self._callback()
+def _none_if_missing(value: Any) -> Any:
+    """Return None for NaN, NaT and pd.NA scalars, the value otherwise."""
+    # NaN and NaT are the only scalars that compare unequal to themselves
+    return None if value is pd.NA or value != value else value
 
-    @override
-    def extend(self, iterable: Iterable[T]) -> None:
-        super().extend(iterable)
-        self._callback()
-
-    @override
-    def insert(self, index: SupportsIndex, item: T) -> None:
-        super().insert(index, item)
-        self._callback()
 
-    @override
-    def remove(self, item: T) -> None:
-        super().remove(item)
-        self._callback()
+# Column data types of NumPy dtypes by dtype.kind
+_NUMPY_KIND_TYPES: Dict[str, str] = {
+    'i': 'numeric', 'u': 'numeric', 'f': 'numeric', 'c': 'numeric', 'b': 'numeric',
+    'M': 'date', 'm': 'text', 'O': 'text', 'U': 'text', 'S': 'text', 'V': 'text'
+}
 
-    @override
-    def pop(self, index: SupportsIndex = -1) -> T:
-        item = super().pop(index)
-        self._callback()
-        return item
 
-    @override
-    def clear(self) -> None:
-        super().clear()
-        self._callback()
+@lru_cache(maxsize=256)
+def _classify_dtype(dtype: Any) -> str:
+    """Map a pandas/NumPy dtype to the Column data type, once per dtype."""
+    if isinstance(dtype, np.dtype):
+        return _NUMPY_KIND_TYPES.get(dtype.kind, 'text')
+    # Extension dtypes (categorical, nullable, tz-aware) go through pandas
+    if pd.api.types.is_numeric_dtype(dtype):
+        return 'numeric'
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return 'date'
+    if isinstance(dtype, pd.CategoricalDtype):
+        return 'categorical'
+    return 'text'
 
 
 @dataclass
@@ -68,6 +47,35 @@ class Column:
     original_type: str  # The original pandas data type
     stats: Dict[str, Any] = field(default_factory=dict)  # Statistical metrics
     metadata: Dict[str, Any] = field(default_factory=dict)  # Additional metadata
+    # Computes `stats` on first access for columns created by _deferred()
+    _stats_loader: Optional[Callable[['Column'], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    # Text columns longer than this get an estimated unique count
+    UNIQUE_SAMPLE_ROWS = 10_000
+
+    @classmethod
+    def _deferred(cls, name: str, data_type: str, original_type: str,
+                  loader: Callable[['Column'], Dict[str, Any]]) -> 'Column':
+        """Create a column whose statistics are computed by `loader(column)` when first accessed."""
+        column = cls(name=name, data_type=data_type, original_type=original_type)
+        # Without an instance attribute, reading `stats` goes through __getattr__
+        del column.stats
+        column._stats_loader = loader
+        return column
+
+    def __getattr__(self, name: str) -> Any:
+        """Compute deferred statistics on first access of `stats`."""
+        loader = self.__dict__.get('_stats_loader')
+        if name != 'stats' or loader is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        self.stats = loader(self)
+        self._stats_loader = None
+        return self.stats
+
+    def _stats_pending(self) -> bool:
+        """Whether the statistics are deferred and not computed yet."""
+        return 'stats' not in self.__dict__
 
     @classmethod
     def from_series(cls, name: str, series: pd.Series) -> 'Column':
@@ -87,37 +95,89 @@ class Column:
             A new Column instance
         """
         # Determine data type
-        if pd.api.types.is_numeric_dtype(series):
-            data_type = 'numeric'
-        elif pd.api.types.is_datetime64_dtype(series):
-            data_type = 'date'
-        elif isinstance(series.dtype, pd.CategoricalDtype):
-            data_type = 'categorical'
-        else:
-            data_type = 'text'
+        data_type = _classify_dtype(series.dtype)
 
         # Calculate statistical metrics
-        stats = {}
-        stats['count'] = series.count()
-        stats['null_count'] = series.isna().sum()
+        metadata: Dict[str, Any] = {}
+        if data_type == 'numeric' and isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iuf':
+            stats = cls._array_stats(series)
+        else:
+            # Long pure-string columns only count distinct values in a sample
+            estimate = (data_type == 'text' and len(series) > cls.UNIQUE_SAMPLE_ROWS
+                        and pd.api.types.infer_dtype(series, skipna=True) == 'string')
+            stats = cls._series_stats(series, data_type,
+                                      unique_sample=cls.UNIQUE_SAMPLE_ROWS if estimate else None)
+            if estimate:
+                metadata['nunique_estimated'] = True
+
+        return cls(
+            name=name,
+            data_type=data_type,
+            original_type=str(series.dtype),
+            stats=stats,
+            metadata=metadata
+        )
+
+    @staticmethod
+    def _array_stats(series: pd.Series) -> Dict[str, Any]:
+        """Calculate the numeric metrics of a plain NumPy-backed series.
+
+        All metrics are derived from one array and one NaN mask instead of
+        a separate pandas reduction per metric.
+        """
+        stats: Dict[str, Any] = {}
+        arr = series.to_numpy(copy=False)
+        mask = np.isnan(arr) if arr.dtype.kind == 'f' else None
+        null_count = int(mask.sum()) if mask is not None else 0
+        count = arr.size - null_count
+        stats['count'] = count
+        stats['null_count'] = null_count
         stats['unique_count'] = series.nunique()
 
+        if count > 0:
+            values = arr[~mask] if mask is not None and null_count else arr
+            mean_val = values.sum(dtype=np.float64) / count
+            stats['min'] = values.min()
+            stats['max'] = values.max()
+            stats['mean'] = mean_val
+            stats['median'] = np.median(values)
+            # Sum of squared deviations (not sumsq - sum**2/n) to stay
+            # as accurate as pandas for data with a large offset
+            stats['std'] = (np.sqrt(np.square(values - mean_val).sum() / (count - 1))
+                            if count > 1 else None)
+        else:
+            stats['min'] = None
+            stats['max'] = None
+            stats['mean'] = None
+            stats['median'] = None
+            stats['std'] = None
+
+        return stats
+
+    @staticmethod
+    def _series_stats(series: pd.Series, data_type: str, unique_sample: Optional[int] = None) -> Dict[str, Any]:
+        """Calculate the metrics of any series through pandas.
+
+        If `unique_sample` is given, the unique count is taken from the first
+        `unique_sample` rows only.
+        """
+        stats: Dict[str, Any] = {}
+        count = series.count()
+        stats['count'] = count
+        stats['null_count'] = len(series) - count
+        if unique_sample is None:
+            stats['unique_count'] = series.nunique()
+        else:
+            stats['unique_count'] = series.head(unique_sample).nunique()
+
         if data_type == 'numeric':
-            # Check if the series is not empty before calculating statistics
-            if not series.empty and series.notna().any():
-                min_val = series.min()
-                max_val = series.max()
-                mean_val = series.mean()
-                median_val = series.median()
-                std_val = series.std()
-
-                # Use isinstance to check if the value is a scalar
-                # and then pd.isna() for null check
-                stats['min'] = None if isinstance(min_val, float) and pd.isna(min_val) else min_val
-                stats['max'] = None if isinstance(max_val, float) and pd.isna(max_val) else max_val
-                stats['mean'] = None if isinstance(mean_val, float) and pd.isna(mean_val) else mean_val
-                stats['median'] = None if isinstance(median_val, float) and pd.isna(median_val) else median_val
-                stats['std'] = None if isinstance(std_val, float) and pd.isna(std_val) else std_val
+            # Only calculate statistics if there is at least one value
+            if count > 0:
+                stats['min'] = _none_if_missing(series.min())
+                stats['max'] = _none_if_missing(series.max())
+                stats['mean'] = _none_if_missing(series.mean())
+                stats['median'] = _none_if_missing(series.median())
+                stats['std'] = _none_if_missing(series.std())
             else:
                 # Set default values for empty series
                 stats['min'] = None
@@ -126,13 +186,7 @@ class Column:
                 stats['median'] = None
                 stats['std'] = None
 
-        return cls(
-            name=name,
-            data_type=data_type,
-            original_type=str(series.dtype),
-            stats=stats,
-            metadata={}
-        )
+        return stats
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -151,6 +205,25 @@ class Column:
             'metadata': self.metadata
         }
 
+@dataclass(frozen=True, slots=True)
+class _InternTable:
+    """Assigns each distinct string an index into a shared list."""
+    ids: Dict[str, int] = field(default_factory=dict)
+    strings: List[str] = field(default_factory=list)
+
+    def intern(self, value: str) -> int:
+        """Return the index of `value`, appending it on first use."""
+        index = self.ids.get(value)
+        if index is None:
+            index = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+# Dataset attributes get_column_types() is derived from
+_DATASET_COLUMN_TYPE_FIELDS = frozenset({'data', 'columns'})
+
+
 @dataclass
 class Dataset:
     """Represents a processed dataset."""
@@ -160,19 +233,139 @@ class Dataset:
     modified_at: datetime = field(default_factory=datetime.now)
     columns: List[Column] = field(default_factory=list)
 
+    # Maximum share of distinct values for an object column to become categorical
+    CATEGORY_MAX_RATIO = 0.5
+
     def __post_init__(self) -> None:
-        """Initialize columns from DataFrame if not provided."""
+        """Initialize columns if not provided."""
+        # get_column_types() result, cleared whenever data or columns is reassigned
+        self._column_types_cache: Dict[str, str] | None = None
         if not self.columns and not self.data.empty:
             self._initialize_columns()
 
+    @override
+    def __setattr__(self, key: str, value: Any) -> None:
+        """Drop the cached column types when their inputs are replaced."""
+        object.__setattr__(self, key, value)
+        if key in _DATASET_COLUMN_TYPE_FIELDS:
+            object.__setattr__(self, '_column_types_cache', None)
+
+    def get_optimized_data(self) -> pd.DataFrame:
+        """
+        Returns the data with the smallest dtypes that keep all values intact.
+
+        Integer columns are downcast, float columns become float32 where every
+        value survives the round trip, and object columns with few distinct
+        values become categorical. `data` itself keeps its dtypes, since
+        narrowed columns can overflow in arithmetic and categorical columns
+        reject values outside their categories.
+
+        Returns
+        -------
+        pd.DataFrame
+            Shallow copy of the data with narrowed columns, or the data itself
+            if nothing can be narrowed or the column names are not unique
+        """
+        if not self.data.columns.is_unique:
+            return self.data
+
+        optimized: Dict[Any, pd.Series] = {}
+        for col_name, dtype in self.data.dtypes.items():
+            series = self.data[col_name]
+            if not isinstance(dtype, np.dtype):
+                continue
+            if dtype.kind in 'iu':
+                narrowed = pd.to_numeric(series, downcast='integer')
+            elif dtype == np.float64:
+                narrowed = series.astype(np.float32)
+                if not np.array_equal(narrowed.to_numpy(), series.to_numpy(), equal_nan=True):
+                    continue
+            elif dtype == object:
+                if len(series) == 0 or series.nunique() / len(series) >= self.CATEGORY_MAX_RATIO:
+                    continue
+                narrowed = series.astype('category')
+            else:
+                continue
+            if narrowed.dtype != dtype:
+                optimized[col_name] = narrowed
+
+        if not optimized:
+            return self.data
+        data = self.data.copy(deep=False)
+        for col_name, narrowed in optimized.items():
+            data[col_name] = narrowed
+        return data
+
     def _initialize_columns(self) -> None:
-        """Initialize Column objects from DataFrame."""
+        """
+        Initialize Column objects from DataFrame.
+
+        Only names and types are determined here; the statistics of a column
+        are computed when they are first accessed.
+        """
         self.columns = []
-        for col_name in self.data.columns:
-            series = self.data[col_name]
-            if isinstance(series, pd.Series):
-                column = Column.from_series(col_name, series)
-                self.columns.append(column)
+        self._numeric_blocks: Dict[np.dtype, List[Any]] = {}
+        duplicated = self.data.columns.duplicated(keep=False)
+        for col_name, dtype, is_duplicate in zip(self.data.columns, self.data.dtypes, duplicated):
+            if is_duplicate:
+                continue
+            if isinstance(dtype, np.dtype) and dtype.kind in 'iuf':
+                self._numeric_blocks.setdefault(dtype, []).append(col_name)
+            # The loader keeps the dataset and its data alive until the
+            # statistics have been computed
+            column = Column._deferred(
+                name=col_name,
+                data_type=_classify_dtype(dtype),
+                original_type=str(dtype),
+                loader=self._compute_column_stats
+            )
+            self.columns.append(column)
+
+    def _compute_column_stats(self, column: Column) -> Dict[str, Any]:
+        """
+        Computes the statistics of a column created by `_initialize_columns`.
+
+        Plain int/uint/float columns are summarized together with all other
+        pending columns of the same dtype as one 2-D block.
+
+        Parameters
+        ----------
+        column : Column
+            The column whose statistics are requested
+
+        Returns
+        -------
+        Dict[str, Any]
+            Statistics of the column
+        """
+        series = self.data[column.name]
+        names = self._numeric_blocks.get(series.dtype) if isinstance(series.dtype, np.dtype) else None
+        if not names or column.name not in names:
+            computed = Column.from_series(column.name, series)
+            column.metadata.update(computed.metadata)
+            return computed.stats
+
+        pending = {col.name: col for col in self.columns if col._stats_pending() and col.name in names}
+        pending[column.name] = column
+        block_names = list(pending)
+        block = block_stats(self.data[block_names].to_numpy(dtype=series.dtype))
+
+        result: Dict[str, Any] = {}
+        for j, name in enumerate(block_names):
+            stats: Dict[str, Any] = {
+                'count': int(block['count'][j]),
+                'null_count': int(block['null_count'][j]),
+                'unique_count': int(block['unique_count'][j])
+            }
+            for key in ('min', 'max', 'mean', 'median', 'std'):
+                value = block[key][j]
+                stats[key] = None if np.isnan(value) else value
+            if name == column.name:
+                result = stats
+            else:
+                pending[name].stats = stats
+                pending[name]._stats_loader = None
+        return result
 
     def get_preview(self, rows: int = 10) -> pd.DataFrame:
         """
@@ -197,11 +390,15 @@ class Dataset:
         Returns
         -------
         Dict[str, str]
-            Dictionary with column names as keys and data types as values
+            Dictionary with column names as keys and data types as values.
+            The dictionary is cached and shared between calls; do not modify it.
         """
-        if self.columns:
-            return {col.name: col.original_type for col in self.columns}
-        return {col: str(dtype) for col, dtype in self.data.dtypes.items()}
+        if self._column_types_cache is None:
+            if self.columns:
+                self._column_types_cache = {col.name: col.original_type for col in self.columns}
+            else:
+                self._column_types_cache = {col: str(dtype) for col, dtype in self.data.dtypes.items()}
+        return self._column_types_cache
 
     def get_column_by_name(self, name: str) -> Optional[Column]:
         """
@@ -234,7 +431,7 @@ class Dataset:
         metadata = {
             "rows": len(self.data),
             "columns": len(self.data.columns),
-            "column_types": self.get_column_types()
+            "column_types": dict(self.get_column_types())
         }
 
         # Add source information if available
@@ -244,41 +441,59 @@ class Dataset:
         self.metadata = metadata
         self.modified_at = datetime.now()
 
-    def to_json(self) -> Dict[str, Any]:
+    def to_json(self, optimized: bool = False) -> Dict[str, Any]:
         """
         Converts the Dataset to a JSON-serializable dictionary.
 
+        Parameters
+        ----------
+        optimized : bool, optional
+            Write the data in pandas' 'split' orientation, which stores the
+            index once instead of with every value, and store the type names
+            of the columns and of the `column_types` metadata once in a shared
+            `_strings` list referred to by index, by default False
+
         Returns
         -------
         Dict[str, Any]
             JSON-serializable dictionary
         """
+        table = _InternTable() if optimized else None
         columns_data = []
         for column in self.columns:
             # Convert NumPy data types to Python standard types
-            stats = {}
-            for key, value in column.stats.items():
-                # Convert NumPy types to Python standard types
-                if hasattr(value, 'item') and callable(getattr(value, 'item')):
-                    stats[key] = value.item()
-                else:
-                    stats[key] = value
+            stats = {
+                key: value.item() if isinstance(value, np.generic) else value
+                for key, value in column.stats.items()
+            }
 
             columns_data.append({
                 "name": column.name,
-                "data_type": column.data_type,
-                "original_type": column.original_type,
+                "data_type": table.intern(column.data_type) if table else column.data_type,
+                "original_type": table.intern(column.original_type) if table else column.original_type,
                 "stats": stats,
                 "metadata": column.metadata
             })
 
-        return {
-            "data": self.data.to_json(),
-            "metadata": self.metadata,
+        metadata = self.metadata
+        column_types = metadata.get("column_types")
+        if table is not None and isinstance(column_types, dict):
+            metadata = {
+                **metadata,
+                "column_types": {col: table.intern(dtype) for col, dtype in column_types.items()}
+            }
+
+        json_data: Dict[str, Any] = {
+            "data": self.data.to_json(orient='split') if optimized else self.data.to_json(),
+            "metadata": metadata,
             "created_at": self.created_at.isoformat(),
             "modified_at": self.modified_at.isoformat(),
             "columns": columns_data
         }
+        if table is not None:
+            json_data["data_orient"] = 'split'
+            json_data["_strings"] = table.strings
+        return json_data
 
     @classmethod
     def from_json(cls, json_data: Dict[str, Any]) -> 'Dataset':
@@ -288,7 +503,8 @@ class Dataset:
         Parameters
         ----------
         json_data : Dict[str, Any]
-            JSON dictionary with Dataset data
+            JSON dictionary with Dataset data, as written by `to_json`
+            with or without `optimized`
 
         Returns
         -------
@@ -297,12 +513,25 @@ class Dataset:
         """
         from io import StringIO
 
+        # Type names written with optimized=True are indices into _strings
+        strings: List[str] = json_data.get("_strings", [])
+
+        def text(value: Any) -> Any:
+            return strings[value] if strings and isinstance(value, int) else value
+
+        metadata = json_data["metadata"]
+        if strings and isinstance(metadata.get("column_types"), dict):
+            metadata = {
+                **metadata,
+                "column_types": {col: text(dtype) for col, dtype in metadata["column_types"].items()}
+            }
+
         # Create DataFrame from JSON
-        df = pd.read_json(StringIO(json_data["data"]))
+        df = pd.read_json(StringIO(json_data["data"]), orient=json_data.get("data_orient", "columns"))
 
         # Restore data types from metadata if available
-        if "metadata" in json_data and "column_types" in json_data["metadata"]:
-            column_types = json_data["metadata"]["column_types"]
+        if "column_types" in metadata:
+            column_types = metadata["column_types"]
             for col, dtype in column_types.items():
                 if col in df.columns:
                     # Try to restore the original data type
@@ -321,7 +550,7 @@ class Dataset:
         # Create Dataset
         dataset = cls(
             data=df,
-            metadata=json_data["metadata"],
+            metadata=metadata,
             created_at=datetime.fromisoformat(json_data["created_at"]),
             modified_at=datetime.fromisoformat(json_data["modified_at"])
         )
@@ -332,8 +561,8 @@ class Dataset:
             for col_data in json_data["columns"]:
                 column = Column(
                     name=col_data["name"],
-                    data_type=col_data["data_type"],
-                    original_type=col_data["original_type"],
+                    data_type=text(col_data["data_type"]),
+                    original_type=text(col_data["original_type"]),
                     stats=col_data["stats"],
                     metadata=col_data["metadata"]
                 )
@@ -377,12 +606,76 @@ class DataSource:
 
     def get_visualization_by_id(self, visualization_id: str) -> Optional[Visualization]:
         """Get a visualization by its ID."""
+        # A data source holds few visualizations; scanning the list also sees
+        # replacements and in-place edits, which an index would have to track
         for vis in self.visualizations:
             if vis.id == visualization_id:
                 return vis
         return None
 
 
+T = TypeVar('T')
+
+
+class _TrackingList(list[T]):
+    """A list subclass that tracks modifications and calls a callback when modified."""
+
+    def __init__(self, initial_items: Iterable[T], callback: Callable[[], None]) -> None:
+        super().__init__(initial_items)
+        self._callback = callback
+
+    @override
+    def __setitem__(self, key: SupportsIndex | slice, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._callback()
+
+    @override
+    def __delitem__(self, key: SupportsIndex | slice) -> None:
+        super().__delitem__(key)
+        self._callback()
+
+    @override
+    def __iadd__(self, iterable: Iterable[T]) -> '_TrackingList[T]':
+        _ = super().__iadd__(iterable)
+        self._callback()
+        return self
+
+    @override
+    def append(self, item: T) -> None:
+        super().append(item)
+        self._callback()
+
+    @override
+    def extend(self, iterable: Iterable[T]) -> None:
+        super().extend(iterable)
+        self._callback()
+
+    @override
+    def insert(self, index: SupportsIndex, item: T) -> None:
+        super().insert(index, item)
+        self._callback()
+
+    @override
+    def remove(self, item: T) -> None:
+        super().remove(item)
+        self._callback()
+
+    @override
+    def pop(self, index: SupportsIndex = -1) -> T:
+        item = super().pop(index)
+        self._callback()
+        return item
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self._callback()
+
+
+# Project attributes whose reassignment counts as an unsaved change
+_PROJECT_TRACKED_FIELDS = frozenset({'name', 'data_sources'})
+
+
 @dataclass
 class Project(Observable):
     """Represents a project in the application."""
@@ -393,51 +686,59 @@ class Project(Observable):
     file_path: Optional[Path] = None
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     _last_saved_state: Dict[str, Any] | None = None  # For tracking changes
-    _collections_modified: bool = False  # Additional flag to track collection modifications
 
     def __post_init__(self) -> None:
-        """Initialize the Observable parent class and setup collection tracking."""
+        """Initialize the Observable parent class and setup change tracking."""
         Observable.__init__(self)
 
-        # Replace the default lists with custom tracking lists
-        self.data_sources = _TrackingList(self.data_sources, self._on_collection_modified)
+        # Every change bumps the version; the project is dirty while it
+        # differs from the version recorded at the last save
+        self._version = 0
+        self._saved_version = 0 if self._last_saved_state is not None else -1
+
+        # Set by every modification of data_sources (see _TrackingList)
+        self._collections_modified = False
+
+    @override
+    def __setattr__(self, key: str, value: Any) -> None:
+        """Count assignments to tracked attributes as changes."""
+        if key == 'data_sources':
+            # Track modifications of the list itself, not only its reassignment
+            value = _TrackingList(value, self._on_collection_modified)
+        object.__setattr__(self, key, value)
+        if key in _PROJECT_TRACKED_FIELDS and '_version' in self.__dict__:
+            self._version += 1
 
     def _on_collection_modified(self) -> None:
         """Called when any collection is modified."""
-        self._collections_modified = True
+        self.touch()
         self.modified = datetime.now()
 
+    def touch(self) -> None:
+        """Flag the collections as modified, e.g. after editing a data source in place."""
+        self._collections_modified = True
+        self._version += 1
+
     def has_unsaved_changes(self) -> bool:
         """Check if the project has unsaved changes."""
-        if self._last_saved_state is None:
-            return True
-
-        # Check if collections have been modified
-        if self._collections_modified:
-            return True
-
-        # Check basic attributes first
-        if self.name != self._last_saved_state.get('name'):
-            return True
-
-        # Modified time is expected to change during saves
-
-        # Check if collections themselves have changed in length
-        saved_data_sources = self._last_saved_state.get('data_sources', [])
-
-        # If the lists are different lengths, something has changed
-        if len(self.data_sources) != len(saved_data_sources):
-            return True
+        return self._version != self._saved_version or self._collections_modified
 
-        # Direct modification to the data_sources list is tracked by _collections_modified,
-        # which we checked earlier. Simple length comparison is sufficient for the remaining
-        # checks
+    def mark_as_saved(self, state: Dict[str, Any] | None = None) -> None:
+        """Mark the current state as saved.
 
-        return False
-
-    def mark_as_saved(self, state: Dict[str, Any]) -> None:
-        """Mark the current state as saved."""
+        Args:
+            state: Description of the saved state, returned by get_saved_state();
+                a snapshot of name, id, modified and data_sources if omitted
+        """
+        if state is None:
+            state = {
+                'name': self.name,
+                'id': self.id,
+                'modified': self.modified,
+                'data_sources': list(self.data_sources),
+            }
         self._last_saved_state = state
+        self._saved_version = self._version
         self._collections_modified = False
 
     def add_data_source(self, data_source: DataSource) -> None:
@@ -456,10 +757,16 @@ class Project(Observable):
         Args:
             data_source: The data source to remove
         """
-        if data_source in self.data_sources:
-            self.data_sources.remove(data_source)
-            self.modified = datetime.now()
-            self.notify_observers(event="data_source_removed", data_source=data_source)
+        # Match by id and identity; DataSource.__eq__ would compare whole datasets
+        existing = self.get_data_source_by_id(data_source.id)
+        if existing is None:
+            return
+        for position, ds in enumerate(self.data_sources):
+            if ds is existing:
+                del self.data_sources[position]
+                break
+        self.modified = datetime.now()
+        self.notify_observers(event="data_source_removed", data_source=data_source)
 
     def rename(self, new_name: str) -> None:
         """Rename the project.
@@ -486,7 +793,7 @@ class Project(Observable):
         Args:
             state: The state to set as the last saved state
         """
-        self._last_saved_state = state
+        self.mark_as_saved(state)
 
     def set_collections_modified(self, modified: bool) -> None:
         """Set the collections modified flag.
@@ -505,6 +812,8 @@ class Project(Observable):
         Returns:
             The data source with the given ID, or None if not found
         """
+        # Like DataSource.get_visualization_by_id, a scan also sees items
+        # replaced in place, which an index would miss
         for ds in self.data_sources:
             if ds.id == data_source_id:
                 return ds
@@ -520,7 +829,7 @@ class Project(Observable):
             The visualization with the given ID, or None if not found
         """
         for ds in self.data_sources:
-            for vis in ds.visualizations:
-                if vis.id == visualization_id:
-                    return vis
+            vis = ds.get_visualization_by_id(visualization_id)
+            if vis is not None:
+                return vis
         return None
@@ -1,17 +1,85 @@
 """Project storage handling module."""
 
+import gzip
 import json
 import logging
+import os
 from pathlib import Path
 from datetime import datetime
 import uuid
-from typing import Dict, Any
+from typing import Any, BinaryIO, Dict, Iterable
 from ..exceptions import ProjectError, ProjectNotFoundError
-from ..config import PROJECT_FILE_EXTENSION
+from ..config import PROJECT_FILE_EXTENSION, PROJECT_FORMAT_VERSION
 from src.data.models import Project, DataSource, Dataset, Visualization
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
+
 logger = logging.getLogger(__name__)
 
+# Project files are gzip-compressed JSON; the fastest level already shrinks
+# the repetitive JSON severalfold
+PROJECT_COMPRESS_LEVEL = 1
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _json_default(value: Any) -> Any:
+    """Convert values the JSON serializers do not handle natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize project data to UTF-8 JSON, using orjson when available.
+
+    Datetimes are written in ISO format and paths as strings.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+
+
+def _write_project(f: BinaryIO, header: Dict[str, Any], data_sources: Iterable[Dict[str, Any]]) -> None:
+    """Write the project as one JSON object, serializing each data source separately.
+
+    The bytes are the same as `_dumps` of the header with a "data_sources" list
+    added, without building that list up front.
+    """
+    head = _dumps(header)
+    # Reopen the header object (drop the closing "\n}") and append the list
+    _ = f.write(head[:-2])
+    _ = f.write(b',\n  "data_sources": [')
+    separator = b'\n'
+    written = False
+    for record in data_sources:
+        _ = f.write(separator)
+        _ = f.write(b'    ' + _dumps(record).replace(b'\n', b'\n    '))
+        separator = b',\n'
+        written = True
+    _ = f.write(b'\n  ]\n}' if written else b']\n}')
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    """Parse UTF-8 JSON project data, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class ProjectStore:
     """Handles project file storage and loading."""
 
@@ -29,66 +97,58 @@ class ProjectStore:
             # Create project directory if it doesn't exist
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Prepare project data for serialization
-            project_data = {
+            # Project header; the data sources follow and are serialized one
+            # at a time, so only one dataset's JSON is held in memory
+            header = {
+                "format_version": PROJECT_FORMAT_VERSION,
                 "name": project.name,
                 "id": project.id,
-                "created": project.created.isoformat(),
-                "modified": datetime.now().isoformat(),
-                "data_sources": []
+                "created": project.created,
+                "modified": datetime.now()
             }
+            data_sources = (ProjectStore._data_source_to_json(ds) for ds in project.data_sources)
 
-            # Add data sources with their datasets and visualizations
-            for ds in project.data_sources:
-                data_source_data: Dict[str, Any] = {
-                    "id": ds.id,
-                    "name": ds.name,
-                    "source_type": ds.source_type,
-                    "file_path": str(ds.file_path),
-                    "created_at": ds.created_at.isoformat(),
-                    "dataset": None,
-                    "visualizations": []
-                }
-
-                # Add dataset if available
-                if ds.dataset:
-                    data_source_data["dataset"] = ds.dataset.to_json()
-
-                # Add visualizations
-                visualizations_list = data_source_data["visualizations"]
-                if isinstance(visualizations_list, list):
-                    for vis in ds.visualizations:
-                        visualizations_list.append({
-                            "id": vis.id,
-                            "name": vis.name,
-                            "chart_type": vis.chart_type,
-                            "config": vis.config,
-                            "created_at": vis.created_at.isoformat(),
-                            "modified_at": vis.modified_at.isoformat()
-                        })
-
-                data_sources_list = project_data["data_sources"]
-                if isinstance(data_sources_list, list):
-                    data_sources_list.append(data_source_data)
-
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(project_data, f, indent=2)
+            # Write next to the target and swap it in once complete, so a failed
+            # save never leaves a truncated project file behind
+            temp_path = file_path.with_name(file_path.name + '.tmp')
+            try:
+                with open(temp_path, 'wb') as raw, gzip.GzipFile(
+                        fileobj=raw, mode='wb', compresslevel=PROJECT_COMPRESS_LEVEL, mtime=0) as f:
+                    _write_project(f, header, data_sources)
+                os.replace(temp_path, file_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
             project.file_path = file_path
             logger.debug(f"Project saved successfully to {file_path}")
         except Exception as e:
             logger.error(f"Error saving project: {e}")
             raise ProjectError(f"Projekt konnte nicht gespeichert werden: {str(e)}")
 
-        # After successful save, update the saved state
-        # Use public methods to update the project state
-        saved_state = {
-            'name': project.name,
-            'id': project.id,
-            'modified': project.modified,
-            'data_sources': project.data_sources.copy(),  # Create copies of the lists
+        # After successful save, record the current version as saved
+        project.mark_as_saved()
+
+    @staticmethod
+    def _data_source_to_json(ds: DataSource) -> Dict[str, Any]:
+        """Prepare a data source with its dataset and visualizations for serialization."""
+        return {
+            "id": ds.id,
+            "name": ds.name,
+            "source_type": ds.source_type,
+            "file_path": ds.file_path,
+            "created_at": ds.created_at,
+            "dataset": ds.dataset.to_json(optimized=True) if ds.dataset else None,
+            "visualizations": [
+                {
+                    "id": vis.id,
+                    "name": vis.name,
+                    "chart_type": vis.chart_type,
+                    "config": vis.config,
+                    "created_at": vis.created_at,
+                    "modified_at": vis.modified_at
+                }
+                for vis in ds.visualizations
+            ]
         }
-        project.set_saved_state(saved_state)
-        project.set_collections_modified(False)  # Reset the modification flag after saving
 
     @staticmethod
     def load(file_path: str | Path) -> Project:
@@ -100,25 +160,29 @@ class ProjectStore:
             raise ProjectNotFoundError(f"Projektdatei nicht gefunden: {file_path}")
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            # Older project files are plain, uncompressed JSON
+            if raw.startswith(GZIP_MAGIC):
+                raw = gzip.decompress(raw)
+            project_data = _loads(raw)
 
             # Create data sources with their datasets and visualizations
             data_sources = []
 
             for ds_data in project_data.get("data_sources", []):
                 # Create visualizations
-                visualizations = []
-                for vis_data in ds_data.get("visualizations", []):
-                    visualization = Visualization(
+                visualizations = [
+                    Visualization(
                         name=vis_data["name"],
                         chart_type=vis_data["chart_type"],
                         config=vis_data["config"],
-                        created_at=datetime.fromisoformat(vis_data["created_at"]),
-                        modified_at=datetime.fromisoformat(vis_data["modified_at"]),
+                        created_at=_parse_datetime(vis_data["created_at"]),
+                        modified_at=_parse_datetime(vis_data["modified_at"]),
                         id=vis_data.get("id", str(uuid.uuid4()))
                     )
-                    visualizations.append(visualization)
+                    for vis_data in ds_data.get("visualizations", [])
+                ]
 
                 # Create dataset if available
                 dataset = None
@@ -131,15 +195,16 @@ class ProjectStore:
                     name=ds_data["name"],
                     source_type=ds_data["source_type"],
                     file_path=Path(ds_data["file_path"]),
-                    created_at=datetime.fromisoformat(ds_data["created_at"]),
+                    created_at=_parse_datetime(ds_data["created_at"]),
                     id=ds_data.get("id", str(uuid.uuid4())),
                     dataset=dataset,
                     visualizations=visualizations
                 )
                 data_sources.append(data_source)
 
-            # Handle legacy format (pre-restructuring)
-            if "datasets" in project_data or "visualizations" in project_data:
+            # Handle legacy format (pre-restructuring); versioned files never use it
+            if project_data.get("format_version", 1) < PROJECT_FORMAT_VERSION and (
+                    "datasets" in project_data or "visualizations" in project_data):
                 logger.warning("Loading project in legacy format. Converting to new format.")
 
                 # Create datasets from legacy format if needed
@@ -163,8 +228,8 @@ class ProjectStore:
                             name=v_data["name"],
                             chart_type=v_data["chart_type"],
                             config=v_data["config"],
-                            created_at=datetime.fromisoformat(v_data["created_at"]),
-                            modified_at=datetime.fromisoformat(v_data["modified_at"]),
+                            created_at=_parse_datetime(v_data["created_at"]),
+                            modified_at=_parse_datetime(v_data["modified_at"]),
                             id=str(uuid.uuid4())
                         )
                         # Assign to first data source as a fallback
@@ -174,8 +239,8 @@ class ProjectStore:
             # Create project
             project = Project(
                 name=project_data["name"],
-                created=datetime.fromisoformat(project_data["created"]),
-                modified=datetime.fromisoformat(project_data["modified"]),
+                created=_parse_datetime(project_data["created"]),
+                modified=_parse_datetime(project_data["modified"]),
                 data_sources=data_sources,
                 file_path=file_path,
                 id=project_data.get("id", str(uuid.uuid4()))
@@ -2,10 +2,19 @@
 Core functionality for data transformation and cleaning operations.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
-from typing import Any, Callable, TypeVar, cast
+from functools import partial
+from typing import Any, Callable, Iterable, TypeVar, cast
+import logging
+import re
+import warnings
+import numpy as np
 import pandas as pd
 
+logger = logging.getLogger(__name__)
+
 # Define a type variable for Series
 SeriesT = TypeVar('SeriesT', bound=pd.Series)
 
@@ -50,6 +59,271 @@ class TransformationOperation(Enum):
     OUTLIER_WINSORIZE = auto()
 
 
+# Transformation functions; parameters are bound with functools.partial
+
+def _fill_first_value(series: pd.Series) -> pd.Series:
+    """Fill missing values with the first value, or "" for an empty series."""
+    return cast(pd.Series, series.fillna(series.iloc[0] if len(series) > 0 else ""))
+
+
+def _replace_mean(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(series):
+        return cast(pd.Series, series.fillna(series.mean()))
+    return _fill_first_value(series)
+
+
+def _replace_median(series: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(series):
+        return cast(pd.Series, series.fillna(series.median()))
+    return _fill_first_value(series)
+
+
+def _replace_mode(series: pd.Series) -> pd.Series:
+    mode = series.mode()
+    if not mode.empty:
+        return cast(pd.Series, series.fillna(mode.iloc[0]))
+    return _fill_first_value(series)
+
+
+def _replace_custom(series: pd.Series, value: Any) -> pd.Series:
+    return cast(pd.Series, series.fillna(value))
+
+
+def _convert_to_numeric(series: pd.Series, errors: str) -> pd.Series:
+    return cast(pd.Series, pd.to_numeric(series, errors=errors))
+
+
+def _convert_to_date(series: pd.Series, date_format: str | None, errors: str) -> pd.Series:
+    return cast(pd.Series, pd.to_datetime(series, format=date_format, errors=errors))
+
+
+def _text_replace(series: pd.Series, pattern: str | re.Pattern[str], replacement: str) -> pd.Series:
+    return cast(pd.Series, series.str.replace(pattern, replacement, regex=True) if hasattr(series, 'str') else series)
+
+
+def _compile_pattern(pattern: str) -> str | re.Pattern[str]:
+    """Compiles a TEXT_REPLACE pattern once; invalid patterns are kept so apply reports them."""
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return pattern
+
+
+def _numeric_round(series: pd.Series, decimals: int) -> pd.Series:
+    return cast(pd.Series, series.round(decimals) if pd.api.types.is_numeric_dtype(series) else series)
+
+
+def _plain_numeric_values(series: pd.Series) -> np.ndarray | None:
+    """Returns the array of a non-empty int, uint or float series backed by NumPy, else None."""
+    if len(series) > 0 and isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iuf':
+        return series.to_numpy()
+    return None
+
+
+def _min_max(values: np.ndarray) -> tuple[Any, Any]:
+    """Minimum and maximum ignoring NaN; NaN for all-missing arrays."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanmin(values), np.nanmax(values)
+
+
+def _mean_std(values: np.ndarray) -> tuple[Any, Any]:
+    """Mean and sample standard deviation ignoring NaN, like pandas."""
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanmean(values), np.nanstd(values, ddof=1)
+
+
+def _numeric_normalize(series: pd.Series) -> pd.Series:
+    # Min-Max Normalization: (x - min) / (max - min)
+    values = _plain_numeric_values(series)
+    if values is None:
+        return cast(pd.Series, (series - series.min()) / (series.max() - series.min()) if pd.api.types.is_numeric_dtype(series) else series)
+    # Missing values are skipped like pandas does; all-missing columns and
+    # zero ranges give NaN/inf without warnings
+    minimum, maximum = _min_max(values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normalized = (values - minimum) / (maximum - minimum)
+    return pd.Series(normalized, index=series.index, name=series.name)
+
+
+def _numeric_standardize(series: pd.Series) -> pd.Series:
+    # Z-Score Standardization: (x - mean) / std
+    values = _plain_numeric_values(series)
+    if values is None:
+        return cast(pd.Series, (series - series.mean()) / series.std() if pd.api.types.is_numeric_dtype(series) else series)
+    mean, std = _mean_std(values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        standardized = (values - mean) / std
+    return pd.Series(standardized, index=series.index, name=series.name)
+
+
+def _limit_range(series: pd.Series, min_val: Any, max_val: Any) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(series):
+        result = series.clip(lower=min_val, upper=max_val)
+        # Explicit type handling to avoid downcasting
+        return cast(pd.Series, result)
+    return series
+
+
+def _outlier_remove(series: pd.Series, threshold: float) -> pd.Series:
+    values = _plain_numeric_values(series)
+    if values is None:
+        return cast(pd.Series, series.mask(
+            abs(series - series.mean()) > threshold * series.std(),
+            None
+        ) if pd.api.types.is_numeric_dtype(series) else series)
+    # Statistics and the outlier mask on the array; masking stays in pandas
+    # so the resulting dtype is unchanged
+    mean, std = _mean_std(values)
+    with np.errstate(invalid='ignore'):
+        outliers = np.abs(values - mean) > threshold * std
+    return cast(pd.Series, series.mask(outliers, None))
+
+
+def _winsorize(series: pd.Series, lower: float, upper: float) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(series):
+        # Both percentiles from a single quantile call
+        lower_val, upper_val = series.quantile([lower, upper])
+        # Opt in to the future clip behavior for this call only, without
+        # changing the global option
+        with pd.option_context('future.no_silent_downcasting', True):
+            result = series.clip(lower=lower_val, upper=upper_val)
+        # Ensure that the data type is preserved
+        if result.dtype != series.dtype:
+            result = result.astype(series.dtype)
+        return cast(pd.Series, result)
+    return series
+
+
+def _identity(series: pd.Series) -> pd.Series:
+    return series
+
+
+# Factories building the transformation function of each operation from its
+# parameters. Operations missing here fall back to the identity function.
+_TRANSFORMATION_FACTORIES: dict[
+    TransformationOperation,
+    Callable[[dict[str, Any]], Callable[[pd.Series], pd.Series]]
+] = {
+    # Handling missing values
+    TransformationOperation.REMOVE_MISSING: lambda p: lambda series: cast(pd.Series, series.dropna()),
+    TransformationOperation.REPLACE_MEAN: lambda p: _replace_mean,
+    TransformationOperation.REPLACE_MEDIAN: lambda p: _replace_median,
+    TransformationOperation.REPLACE_MODE: lambda p: _replace_mode,
+    TransformationOperation.REPLACE_CUSTOM: lambda p: partial(_replace_custom, value=p.get('value', '')),
+
+    # Type conversions ('coerce' sets invalid values to NaN)
+    TransformationOperation.CONVERT_TO_NUMERIC: lambda p: partial(
+        _convert_to_numeric, errors=p.get('errors', 'coerce')),
+    TransformationOperation.CONVERT_TO_TEXT: lambda p: lambda series: cast(pd.Series, series.astype(str)),
+    TransformationOperation.CONVERT_TO_DATE: lambda p: partial(
+        _convert_to_date, date_format=p.get('format', None), errors=p.get('errors', 'coerce')),
+    TransformationOperation.CONVERT_TO_CATEGORICAL: lambda p: lambda series: cast(pd.Series, series.astype('category')),
+
+    # Text operations
+    TransformationOperation.TEXT_LOWERCASE: lambda p: lambda series: cast(
+        pd.Series, series.str.lower() if hasattr(series, 'str') else series),
+    TransformationOperation.TEXT_UPPERCASE: lambda p: lambda series: cast(
+        pd.Series, series.str.upper() if hasattr(series, 'str') else series),
+    TransformationOperation.TEXT_TRIM: lambda p: lambda series: cast(
+        pd.Series, series.str.strip() if hasattr(series, 'str') else series),
+    TransformationOperation.TEXT_REPLACE: lambda p: partial(
+        _text_replace, pattern=_compile_pattern(p.get('pattern', '')), replacement=p.get('replacement', '')),
+
+    # Numeric operations
+    TransformationOperation.NUMERIC_ROUND: lambda p: partial(_numeric_round, decimals=p.get('decimals', 0)),
+    TransformationOperation.NUMERIC_NORMALIZE: lambda p: _numeric_normalize,
+    TransformationOperation.NUMERIC_STANDARDIZE: lambda p: _numeric_standardize,
+    TransformationOperation.NUMERIC_LIMIT_RANGE: lambda p: partial(
+        _limit_range, min_val=p.get('min', None), max_val=p.get('max', None)),
+
+    # Outlier handling (threshold in standard deviations, bounds as percentiles)
+    TransformationOperation.OUTLIER_REMOVE: lambda p: partial(_outlier_remove, threshold=p.get('threshold', 3.0)),
+    TransformationOperation.OUTLIER_WINSORIZE: lambda p: partial(
+        _winsorize, lower=p.get('lower', 0.05), upper=p.get('upper', 0.95)),
+}
+
+
+def _column_series(df: pd.DataFrame, column: str) -> pd.Series | None:
+    """Returns the column as a Series, or None if it is missing or not unique."""
+    if column not in df.columns:
+        return None
+    # Explicitly treat the column as a Series
+    series = df[column]
+    # Only if it's actually a Series
+    return series if isinstance(series, pd.Series) else None
+
+
+def _transform_series(
+    column: str,
+    series: pd.Series,
+    index: pd.Index,
+    functions: Iterable[Callable[[pd.Series], pd.Series]]
+) -> pd.Series | None:
+    """
+    Runs transformation functions on one column without touching the DataFrame.
+
+    Parameters
+    ----------
+    column : str
+        Name of the column, used for error messages
+    series : pd.Series
+        Column data
+    index : pd.Index
+        Index of the DataFrame the result will be written to
+    functions : Iterable[Callable[[pd.Series], pd.Series]]
+        Functions to apply in order; a failing function is skipped and the
+        column keeps the result of the previous ones
+
+    Returns
+    -------
+    pd.Series | None
+        Transformed column, or None if every function failed
+    """
+    transformed = False
+    for function in functions:
+        try:
+            result = function(series)
+            if not result.index.equals(index):
+                # Realign to the frame (e.g. after dropping rows) before the
+                # next step, as assigning the column would
+                result = result.reindex(index)
+        except Exception as e:
+            # In case of error, keep the data of the previous step
+            logger.error("Error transforming %s: %s", column, e)
+            continue
+        series = result
+        transformed = True
+    return series if transformed else None
+
+
+def _transform_column(
+    df: pd.DataFrame,
+    column: str,
+    functions: Iterable[Callable[[pd.Series], pd.Series]]
+) -> None:
+    """
+    Runs transformation functions on one column and writes the result back once.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        DataFrame to modify
+    column : str
+        Name of the column to transform
+    functions : Iterable[Callable[[pd.Series], pd.Series]]
+        Functions to apply in order
+    """
+    series = _column_series(df, column)
+    if series is None:
+        return
+    result = _transform_series(column, series, df.index, functions)
+    if result is not None:
+        # Write the result back to the DataFrame
+        df[column] = result
+
+
 class DataTransformation:
     """Represents a single data transformation for a column."""
 
@@ -85,118 +359,11 @@ class DataTransformation:
         Callable[[pd.Series], pd.Series]
             Function for transforming the data
         """
-        # Implementation of a factory for the different transformations
-
-        # Handling missing values
-        if self.operation == TransformationOperation.REMOVE_MISSING:
-            # Cast is used to specify the return type as pd.Series
-            return lambda series: cast(pd.Series, series.dropna())
-        elif self.operation == TransformationOperation.REPLACE_MEAN:
-            # Lambda with explicit type checking
-            def replace_mean(series: pd.Series) -> pd.Series:
-                if pd.api.types.is_numeric_dtype(series):
-                    return cast(pd.Series, series.fillna(series.mean()))
-                return cast(pd.Series, series.fillna(series.iloc[0] if len(series) > 0 else ""))
-            return replace_mean
-        elif self.operation == TransformationOperation.REPLACE_MEDIAN:
-            # Lambda with explicit type checking
-            def replace_median(series: pd.Series) -> pd.Series:
-                if pd.api.types.is_numeric_dtype(series):
-                    return cast(pd.Series, series.fillna(series.median()))
-                return cast(pd.Series, series.fillna(series.iloc[0] if len(series) > 0 else ""))
-            return replace_median
-        elif self.operation == TransformationOperation.REPLACE_MODE:
-            # Lambda with explicit type checking
-            def replace_mode(series: pd.Series) -> pd.Series:
-                if not series.mode().empty:
-                    return cast(pd.Series, series.fillna(series.mode().iloc[0]))
-                return cast(pd.Series, series.fillna(series.iloc[0] if len(series) > 0 else ""))
-            return replace_mode
-        elif self.operation == TransformationOperation.REPLACE_CUSTOM:
-            value = self.parameters.get('value', '')
-            return lambda series: cast(pd.Series, series.fillna(value))
-
-        # Type conversions
-        elif self.operation == TransformationOperation.CONVERT_TO_NUMERIC:
-            errors = self.parameters.get('errors', 'coerce')  # 'coerce' sets invalid values to NaN
-            return lambda series: cast(pd.Series, pd.to_numeric(series, errors=errors))
-        elif self.operation == TransformationOperation.CONVERT_TO_TEXT:
-            return lambda series: cast(pd.Series, series.astype(str))
-        elif self.operation == TransformationOperation.CONVERT_TO_DATE:
-            date_format = self.parameters.get('format', None)
-            errors = self.parameters.get('errors', 'coerce')
-            return lambda series: cast(pd.Series, pd.to_datetime(series, format=date_format, errors=errors))
-        elif self.operation == TransformationOperation.CONVERT_TO_CATEGORICAL:
-            return lambda series: cast(pd.Series, series.astype('category'))
-
-        # Text operations
-        elif self.operation == TransformationOperation.TEXT_LOWERCASE:
-            return lambda series: cast(pd.Series, series.str.lower() if hasattr(series, 'str') else series)
-        elif self.operation == TransformationOperation.TEXT_UPPERCASE:
-            return lambda series: cast(pd.Series, series.str.upper() if hasattr(series, 'str') else series)
-        elif self.operation == TransformationOperation.TEXT_TRIM:
-            return lambda series: cast(pd.Series, series.str.strip() if hasattr(series, 'str') else series)
-        elif self.operation == TransformationOperation.TEXT_REPLACE:
-            pattern = self.parameters.get('pattern', '')
-            replacement = self.parameters.get('replacement', '')
-            return lambda series: cast(pd.Series, series.str.replace(pattern, replacement, regex=True) if hasattr(series, 'str') else series)
-
-        # Numeric operations
-        elif self.operation == TransformationOperation.NUMERIC_ROUND:
-            decimals = self.parameters.get('decimals', 0)
-            return lambda series: cast(pd.Series, series.round(decimals) if pd.api.types.is_numeric_dtype(series) else series)
-        elif self.operation == TransformationOperation.NUMERIC_NORMALIZE:
-            # Min-Max Normalization: (x - min) / (max - min)
-            return lambda series: cast(pd.Series, (series - series.min()) / (series.max() - series.min()) if pd.api.types.is_numeric_dtype(series) else series)
-        elif self.operation == TransformationOperation.NUMERIC_STANDARDIZE:
-            # Z-Score Standardization: (x - mean) / std
-            return lambda series: cast(pd.Series, (series - series.mean()) / series.std() if pd.api.types.is_numeric_dtype(series) else series)
-        elif self.operation == TransformationOperation.NUMERIC_LIMIT_RANGE:
-            min_val = self.parameters.get('min', None)
-            max_val = self.parameters.get('max', None)
-
-            def limit_range(series: pd.Series) -> pd.Series:
-                if pd.api.types.is_numeric_dtype(series):
-                    result = series.clip(lower=min_val, upper=max_val)
-                    # Explicit type handling to avoid downcasting
-                    return cast(pd.Series, result)
-                return series
-
-            return limit_range
-
-        # Outlier handling
-        elif self.operation == TransformationOperation.OUTLIER_REMOVE:
-            threshold = self.parameters.get('threshold', 3.0)  # Standard deviations
-            return lambda series: cast(pd.Series, series.mask(
-                abs(series - series.mean()) > threshold * series.std(),
-                None
-            ) if pd.api.types.is_numeric_dtype(series) else series)
-        elif self.operation == TransformationOperation.OUTLIER_WINSORIZE:
-            lower = self.parameters.get('lower', 0.05)  # Lower percentile
-            upper = self.parameters.get('upper', 0.95)  # Upper percentile
-
-            def winsorize(series: pd.Series) -> pd.Series:
-                if pd.api.types.is_numeric_dtype(series):
-                    lower_val = series.quantile(lower)
-                    upper_val = series.quantile(upper)
-
-                    # Set the option to change the downcasting behavior
-                    pd.set_option('future.no_silent_downcasting', True)
-                    try:
-                        result = series.clip(lower=lower_val, upper=upper_val)
-                        # Ensure that the data type is preserved
-                        if result.dtype != series.dtype:
-                            result = result.astype(series.dtype)
-                        return cast(pd.Series, result)
-                    finally:
-                        # Reset the option
-                        pd.set_option('future.no_silent_downcasting', False)
-                return series
-
-            return winsorize
-
-        # Default behavior: Identity function
-        return lambda series: cast(pd.Series, series)
+        factory = _TRANSFORMATION_FACTORIES.get(self.operation)
+        if factory is None:
+            # Default behavior: Identity function
+            return _identity
+        return factory(self.parameters)
 
     def apply(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -210,24 +377,26 @@ class DataTransformation:
         Returns
         -------
         pd.DataFrame
-            Transformed DataFrame
+            Transformed DataFrame; columns other than the transformed one
+            share their data with the input
         """
-        result_df = df.copy()
-        if self.column in result_df.columns:
-            # Explicitly treat the column as a Series
-            try:
-                # Explicitly handle the type and only process pd.Series
-                series = result_df[self.column].copy()
-                # Only if it's actually a Series
-                if isinstance(series, pd.Series):
-                    transformed_series = self._transformation_function(series)
-                    # Copy the result back to the DataFrame
-                    result_df[self.column] = transformed_series
-            except Exception as e:
-                # In case of error, keep the original data
-                print(f"Error transforming {self.column}: {e}")
+        # The transformed column is replaced, never written into, so a
+        # shallow copy leaves the input unchanged
+        result_df = df.copy(deep=False)
+        self._apply_inplace(result_df)
         return result_df
 
+    def _apply_inplace(self, df: pd.DataFrame) -> None:
+        """
+        Applies the transformation by replacing the column of the given DataFrame.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            DataFrame to modify; left unchanged if the transformation fails
+        """
+        _transform_column(df, self.column, [self._transformation_function])
+
     def get_description(self) -> str:
         """
         Creates a user-friendly description of the transformation.
@@ -245,6 +414,9 @@ class DataTransformation:
 class DataFrameTransformer:
     """Manages all transformations for a DataFrame."""
 
+    # Minimum number of rows before columns are transformed in parallel
+    PARALLEL_MIN_ROWS = 100_000
+
     def __init__(self) -> None:
         """Initializes a new DataFrame transformer."""
         self.transformations: list[DataTransformation] = []
@@ -290,9 +462,32 @@ class DataFrameTransformer:
         pd.DataFrame
             Transformed DataFrame
         """
+        # Copy once; the transformations of each column then run on that
+        # column together and write it back in place once
         result_df = df.copy()
+        runs: dict[str, list[Callable[[pd.Series], pd.Series]]] = {}
         for transformation in self.transformations:
-            result_df = transformation.apply(result_df)
+            runs.setdefault(transformation.column, []).append(transformation._transformation_function)
+
+        workers = min(len(runs), os.cpu_count() or 1)
+        if workers < 2 or len(result_df) < self.PARALLEL_MIN_ROWS:
+            for column, functions in runs.items():
+                _transform_column(result_df, column, functions)
+            return result_df
+
+        # Columns are independent, so large frames transform them in parallel;
+        # most vectorized pandas operations release the GIL
+        columns = {column: series for column in runs
+                   if (series := _column_series(result_df, column)) is not None}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                column: executor.submit(_transform_series, column, series, result_df.index, runs[column])
+                for column, series in columns.items()
+            }
+        for column, future in futures.items():
+            transformed = future.result()
+            if transformed is not None:
+                result_df[column] = transformed
         return result_df
 
     def get_transformation_descriptions(self) -> list[str]:
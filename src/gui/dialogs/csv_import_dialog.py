@@ -1,21 +1,60 @@
 """CSV import dialog for DataInspect application."""
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, override
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton,
-    QCheckBox, QSpinBox, QTableWidget, QTableWidgetItem, QGroupBox,
+    QCheckBox, QSpinBox, QTableView, QGroupBox,
     QFormLayout, QDialogButtonBox, QLineEdit, QGridLayout, QTabWidget,
     QWidget
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 
 import pandas as pd
 
 from ...data.importers.csv_importer import CSVImporter
+from ..table_model import DataFrameTableModel
+
+class _PreviewSignals(QObject):
+    """Signals of a preview worker; QRunnable itself cannot emit signals."""
+
+    # Sequence number, preview DataFrame (or None), error message (or None)
+    finished = pyqtSignal(int, object, object)
+
+
+class _PreviewWorker(QRunnable):
+    """Reads a CSV preview on a thread pool thread."""
+
+    def __init__(self, seq: int, file_path: Path, options: Dict[str, Any]) -> None:
+        """Initialize the worker.
+
+        Args:
+            seq: Sequence number identifying the request
+            file_path: Path to the CSV file
+            options: Keyword arguments for CSVImporter.get_preview
+        """
+        super().__init__()
+        self.signals = _PreviewSignals()
+        self._seq = seq
+        self._file_path = file_path
+        self._options = options
+
+    @override
+    def run(self) -> None:
+        """Read the preview and report the result."""
+        preview_df, error = CSVImporter.get_preview(self._file_path, **self._options)
+        self.signals.finished.emit(self._seq, preview_df, error)
+
 
 class CSVImportDialog(QDialog):
     """Dialog for configuring CSV import options."""
 
+    # Number of rows read for the preview, independent of the file size
+    PREVIEW_ROWS = 200
+    # Delay after the last option change before the preview is refreshed
+    PREVIEW_DEBOUNCE_MS = 250
+    # Larger files are not previewed until the user asks for it
+    PREVIEW_AUTOLOAD_MAX_BYTES = 50 * 1024 * 1024
+
     def __init__(self, file_path: Path, parent=None) -> None:
         """Initialize the dialog.
 
@@ -45,8 +84,37 @@ class CSVImportDialog(QDialog):
             # Use default if detection fails
             pass
 
+        # Option edits come in bursts (e.g. typing a delimiter), so the preview
+        # is refreshed once the options have been stable for a moment
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(self.PREVIEW_DEBOUNCE_MS)
+        _ = self._preview_timer.timeout.connect(self._do_update_preview)
+
+        # Previews are read on a pool thread; results are delivered back to the
+        # GUI thread through the worker's signal
+        self._preview_seq = 0
+        self._preview_worker: Optional[_PreviewWorker] = None
+        # Whether the options changed since the shown preview was requested
+        self._dirty = True
+
         self.setup_ui()
-        self.update_preview()
+        if self._autoload_preview():
+            self._do_update_preview()
+        else:
+            self.preview_model.set_dataframe(pd.DataFrame({"Vorschau": ["Vorschau bei 'Anwenden' geladen"]}))
+
+    def _autoload_preview(self) -> bool:
+        """Whether the preview is read as soon as the dialog opens.
+
+        Returns:
+            False for files above PREVIEW_AUTOLOAD_MAX_BYTES, True otherwise
+        """
+        try:
+            return self.file_path.stat().st_size <= self.PREVIEW_AUTOLOAD_MAX_BYTES
+        except OSError:
+            # Let the preview report the problem
+            return True
 
     def setup_ui(self) -> None:
         """Set up the user interface."""
@@ -102,7 +170,7 @@ class CSVImportDialog(QDialog):
         apply_button = QPushButton("Anwenden")
         apply_button.setStyleSheet("background-color: #0078D7; color: white;")
         apply_button.setFixedWidth(120)
-        _ = apply_button.clicked.connect(self.update_preview)
+        _ = apply_button.clicked.connect(self._do_update_preview)
         apply_layout.addWidget(apply_button)
 
         layout.addLayout(apply_layout)
@@ -135,7 +203,9 @@ class CSVImportDialog(QDialog):
         self.delimiter_combo.addItems([',', ';', '\\t', '|', ' '])
         self.delimiter_combo.setEditable(True)
         self.delimiter_combo.setCurrentText(str(self.import_options['delimiter']))
-        _ = self.delimiter_combo.currentTextChanged.connect(self.on_option_changed)
+        # Special handling for tab character
+        _ = self.delimiter_combo.currentTextChanged.connect(
+            lambda text: self.set_import_option('delimiter', '\t' if text == '\\t' else text))
         col1_layout.addRow("Trennzeichen:", self.delimiter_combo)
 
         # Encoding
@@ -143,20 +213,20 @@ class CSVImportDialog(QDialog):
         self.encoding_combo.addItems(['utf-8', 'latin1', 'iso-8859-1', 'cp1252'])
         self.encoding_combo.setEditable(True)
         self.encoding_combo.setCurrentText(str(self.import_options['encoding']))
-        _ = self.encoding_combo.currentTextChanged.connect(self.on_option_changed)
+        _ = self.encoding_combo.currentTextChanged.connect(lambda text: self.set_import_option('encoding', text))
         col1_layout.addRow("Zeichenkodierung:", self.encoding_combo)
 
         # Header
         self.header_check = QCheckBox()
         self.header_check.setChecked(bool(self.import_options['has_header']))
-        _ = self.header_check.stateChanged.connect(self.on_option_changed)
+        _ = self.header_check.toggled.connect(lambda checked: self.set_import_option('has_header', checked))
         col1_layout.addRow("Kopfzeile vorhanden:", self.header_check)
 
         # Skip rows (moved from Advanced options)
         self.skip_rows_spin = QSpinBox()
         self.skip_rows_spin.setRange(0, 100)
         self.skip_rows_spin.setValue(int(self.import_options['skip_rows']))
-        _ = self.skip_rows_spin.valueChanged.connect(self.on_option_changed)
+        _ = self.skip_rows_spin.valueChanged.connect(lambda value: self.set_import_option('skip_rows', value))
         col1_layout.addRow("Zeilen überspringen:", self.skip_rows_spin)
 
         # Add explanation for header handling
@@ -176,14 +246,14 @@ class CSVImportDialog(QDialog):
         self.decimal_combo = QComboBox()
         self.decimal_combo.addItems(['.', ','])
         self.decimal_combo.setCurrentText(str(self.import_options['decimal']))
-        _ = self.decimal_combo.currentTextChanged.connect(self.on_option_changed)
+        _ = self.decimal_combo.currentTextChanged.connect(lambda text: self.set_import_option('decimal', text))
         col2_layout.addRow("Dezimaltrennzeichen:", self.decimal_combo)
 
         # Thousands separator
         self.thousands_combo = QComboBox()
         self.thousands_combo.addItems([',', '.', ' ', ''])
         self.thousands_combo.setCurrentText(str(self.import_options['thousands']))
-        _ = self.thousands_combo.currentTextChanged.connect(self.on_option_changed)
+        _ = self.thousands_combo.currentTextChanged.connect(lambda text: self.set_import_option('thousands', text))
         col2_layout.addRow("Tausendertrennzeichen:", self.thousands_combo)
 
         # Add explanation for number formatting
@@ -209,9 +279,15 @@ class CSVImportDialog(QDialog):
         preview_group = QGroupBox("Datenvorschau")
         preview_inner_layout = QVBoxLayout(preview_group)
 
-        # Table widget for preview
-        self.preview_table = QTableWidget()
+        # Table view for preview; cell text is only created for visible cells
+        self.preview_model = DataFrameTableModel(self)
+        self.preview_table = QTableView()
+        self.preview_table.setModel(self.preview_model)
         self.preview_table.setAlternatingRowColors(True)
+        # Fixed section sizes, so layout does not depend on the cell contents;
+        # double-clicking a column border still fits that column
+        self.preview_table.verticalHeader().setDefaultSectionSize(22)
+        self.preview_table.horizontalHeader().setDefaultSectionSize(120)
         preview_inner_layout.addWidget(self.preview_table)
 
         preview_layout.addWidget(preview_group)
@@ -222,16 +298,27 @@ class CSVImportDialog(QDialog):
         Args:
             index: Index of the newly selected tab
         """
-        # Update the preview when switching tabs
-        if index == 1:  # Preview tab
-            self.update_preview()
+        # Update the preview when switching tabs, unless it is already current
+        if index == 1 and self._dirty:  # Preview tab
+            self._do_update_preview()
 
     def on_name_changed(self) -> None:
         """Handle changes to the data source name."""
         self.import_options['name'] = self.name_edit.text()
 
+    def set_import_option(self, key: str, value: Any) -> None:
+        """Store a changed import option and schedule a preview update.
+
+        Args:
+            key: Name of the option
+            value: New value
+        """
+        self.import_options[key] = value
+        self._dirty = True
+        self.update_preview()
+
     def on_option_changed(self) -> None:
-        """Handle changes to import options."""
+        """Read all import options from the widgets."""
         # Update import options
         self.import_options['delimiter'] = self.delimiter_combo.currentText()
         self.import_options['encoding'] = self.encoding_combo.currentText()
@@ -245,23 +332,43 @@ class CSVImportDialog(QDialog):
             self.import_options['delimiter'] = '\t'
 
     def update_preview(self) -> None:
-        """Update the preview table with current options."""
-        self.on_option_changed()  # Ensure options are up to date
-
-        # Get preview data
-        preview_df, error = CSVImporter.get_preview(
-            self.file_path,
-            delimiter=str(self.import_options['delimiter']),
-            encoding=str(self.import_options['encoding']),
-            has_header=bool(self.import_options['has_header']),
-            skip_rows=int(self.import_options['skip_rows'])
-        )
+        """Schedule a preview update; repeated calls within the debounce interval coalesce."""
+        self._preview_timer.start()
+
+    def _do_update_preview(self) -> None:
+        """Start reading the preview with the current options in the background."""
+        self._preview_timer.stop()  # A pending scheduled update is covered by this one
+
+        # Only the result of the latest request is shown
+        self._preview_seq += 1
+        self._dirty = False
+        worker = _PreviewWorker(self._preview_seq, self.file_path, {
+            'delimiter': str(self.import_options['delimiter']),
+            'encoding': str(self.import_options['encoding']),
+            'has_header': bool(self.import_options['has_header']),
+            'skip_rows': int(self.import_options['skip_rows']),
+            'preview_rows': self.PREVIEW_ROWS
+        })
+        _ = worker.signals.finished.connect(self._apply_preview)
+        self._preview_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _apply_preview(self, seq: int, preview_df: Optional[pd.DataFrame], error: Optional[str]) -> None:
+        """Show a preview read in the background, unless a newer one was requested.
+
+        Args:
+            seq: Sequence number of the request the result belongs to
+            preview_df: Preview data (None if error)
+            error: Error message (None if successful)
+        """
+        if seq != self._preview_seq:
+            return
 
         if error:
+            # Read again on the next visit of the preview tab
+            self._dirty = True
             # Show error in preview table
-            self.preview_table.setRowCount(1)
-            self.preview_table.setColumnCount(1)
-            self.preview_table.setItem(0, 0, QTableWidgetItem(error))
+            self.preview_model.set_dataframe(pd.DataFrame({"Fehler": [error]}))
             return
 
         self.preview_df = preview_df
@@ -270,20 +377,7 @@ class CSVImportDialog(QDialog):
             return
 
         # Update preview table
-        self.preview_table.setRowCount(len(preview_df))
-        self.preview_table.setColumnCount(len(preview_df.columns))
-
-        # Set headers
-        self.preview_table.setHorizontalHeaderLabels(preview_df.columns)
-
-        # Fill data
-        for row in range(len(preview_df)):
-            for col in range(len(preview_df.columns)):
-                value = preview_df.iloc[row, col]
-                self.preview_table.setItem(row, col, QTableWidgetItem(str(value)))
-
-        # Resize columns to content
-        self.preview_table.resizeColumnsToContents()
+        self.preview_model.set_dataframe(preview_df)
 
     def get_import_options(self) -> Dict[str, Any]:
         """Get the current import options.
@@ -1,27 +1,157 @@
 """CSV import dialog with data transformation capabilities for DataInspect application."""
-from typing import Optional, Dict, Any
+import logging
+from typing import Optional, Dict, Any, override
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QPushButton,
-    QCheckBox, QSpinBox, QTableWidget, QTableWidgetItem, QGroupBox,
+    QCheckBox, QSpinBox, QTableView, QTableWidget, QTableWidgetItem, QGroupBox,
     QFormLayout, QDialogButtonBox, QLineEdit, QGridLayout, QWidget,
     QListWidget, QDoubleSpinBox, QMenu, QSplitter, QFrame, QHeaderView,
-    QSizePolicy
+    QSizePolicy, QMessageBox
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QAction, QColor, QBrush
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QAction
 
 import pandas as pd
+from pandas.api.types import infer_dtype
 
 from ...data.importers.csv_importer import CSVImporter
 from ...data.transformations.data_transformation import (
     TransformationOperation, DataTransformation,
     DataFrameTransformer
 )
+from ..table_model import MissingValueTableModel
+
+logger = logging.getLogger(__name__)
+
+# Operations that give the same missing values whether applied chunk by chunk
+# or to the whole column. All others depend on column statistics or on the
+# dtype pandas infers, which can differ between a chunk and the whole file.
+_CHUNKABLE_OPERATIONS = frozenset({
+    TransformationOperation.REMOVE_MISSING,
+    TransformationOperation.REPLACE_CUSTOM,
+})
+
+# Data type codes of the preview header by dtype kind
+_KIND_CODES = {
+    'i': "i",  # Integer
+    'u': "i",  # Unsigned integer
+    'f': "f",  # Float
+    'M': "d",  # Date
+    'b': "b",  # Boolean
+}
+
+# Delimiters as entered in the dialog that stand for another character
+_DELIMITER_ALIASES = {'\\t': '\t'}
+
+
+def _name_columns(df: pd.DataFrame, has_header: bool) -> None:
+    """Name the columns 'Spalte_X' if the file has no header."""
+    if not has_header:
+        df.columns = [f"Spalte_{i+1}" for i in range(len(df.columns))]
+
+
+def _count_missing_values(
+    file_path: Path,
+    read_options: Dict[str, Any],
+    has_header: bool,
+    transformer: DataFrameTransformer,
+    full_df: Optional[pd.DataFrame],
+    chunk_rows: int
+) -> tuple[pd.Series, int, Optional[pd.DataFrame], Optional[pd.DataFrame]]:
+    """Count the missing values per column of the complete dataset after all transformations.
+
+    Args:
+        file_path: Path to the CSV file
+        read_options: Keyword arguments for pd.read_csv
+        has_header: Whether the file has a header row
+        transformer: Transformations to apply
+        full_df: Complete dataset if already loaded
+        chunk_rows: Rows per chunk when the file is streamed
+
+    Returns:
+        Missing values per column, number of rows, and the complete dataset
+        and its transformed version if they had to be loaded (otherwise None)
+    """
+    if full_df is None and all(t.operation in _CHUNKABLE_OPERATIONS for t in transformer.transformations):
+        # These transformations give the same missing values chunk by chunk,
+        # so the counts are accumulated without holding the whole file
+        null_counts: Optional[pd.Series] = None
+        total_count = 0
+        with pd.read_csv(file_path, chunksize=chunk_rows, **read_options) as reader:
+            for chunk in reader:
+                _name_columns(chunk, has_header)
+                chunk_counts = transformer.apply_all(chunk).isna().sum()
+                null_counts = chunk_counts if null_counts is None else null_counts.add(chunk_counts, fill_value=0)
+                total_count += len(chunk)
+        return (null_counts if null_counts is not None else pd.Series(dtype='int64')), total_count, None, None
+
+    # Statistics- and dtype-dependent transformations need the complete dataset
+    if full_df is None:
+        full_df = pd.read_csv(file_path, **read_options)
+        _name_columns(full_df, has_header)
+    transformed_full_df = transformer.apply_all(full_df)
+    return transformed_full_df.isna().sum(), len(transformed_full_df), full_df, transformed_full_df
+
+
+class _MissingValuesSignals(QObject):
+    """Signals of a missing values worker; QRunnable itself cannot emit signals."""
+
+    # Sequence number, missing values per column (None on error), number of rows,
+    # complete dataset and its transformed version (None unless loaded)
+    finished = pyqtSignal(int, object, int, object, object)
+
+
+class _MissingValuesWorker(QRunnable):
+    """Counts missing values of the complete dataset on a thread pool thread."""
+
+    def __init__(self, seq: int, file_path: Path, read_options: Dict[str, Any], has_header: bool,
+                 transformer: DataFrameTransformer, full_df: Optional[pd.DataFrame], chunk_rows: int) -> None:
+        """Initialize the worker.
+
+        Args:
+            seq: Sequence number identifying the request
+            file_path: Path to the CSV file
+            read_options: Keyword arguments for pd.read_csv
+            has_header: Whether the file has a header row
+            transformer: Transformations to apply, not shared with the dialog
+            full_df: Complete dataset if already loaded
+            chunk_rows: Rows per chunk when the file is streamed
+        """
+        super().__init__()
+        self.signals = _MissingValuesSignals()
+        self._seq = seq
+        self._file_path = file_path
+        self._read_options = read_options
+        self._has_header = has_header
+        self._transformer = transformer
+        self._full_df = full_df
+        self._chunk_rows = chunk_rows
+
+    @override
+    def run(self) -> None:
+        """Count the missing values and report the result."""
+        try:
+            null_counts, total_count, full_df, transformed_full_df = _count_missing_values(
+                self._file_path, self._read_options, self._has_header,
+                self._transformer, self._full_df, self._chunk_rows
+            )
+        except Exception:
+            # Report the failure anyway, so the dialog does not keep showing stale counts
+            logger.exception("Error counting missing values")
+            self.signals.finished.emit(self._seq, None, 0, None, None)
+            return
+        self.signals.finished.emit(self._seq, null_counts, total_count, full_df, transformed_full_df)
+
 
 class CSVImportDialogWithTransformation(QDialog):
     """Dialog for configuring CSV import options with data transformation capabilities."""
 
+    # Number of rows read for the preview, independent of the file size
+    PREVIEW_ROWS = 2000
+    # Rows per chunk when counting missing values without loading the whole file
+    MISSING_VALUES_CHUNK_ROWS = 200_000
+
     def __init__(self, file_path: Path, parent=None) -> None:
         """Initialize the dialog.
 
@@ -33,8 +163,22 @@ class CSVImportDialogWithTransformation(QDialog):
         self.file_path = file_path
         self.preview_df: Optional[pd.DataFrame] = None
         self.transformed_df: Optional[pd.DataFrame] = None
-        self.full_df: Optional[pd.DataFrame] = None  # Complete dataset for statistics
+        self.full_df: Optional[pd.DataFrame] = None  # Complete dataset, loaded on accept
+        self._full_df_options: Optional[Dict[str, Any]] = None  # read_csv options of full_df
         self.missing_values_info: Dict[str, Dict[str, Any]] = {}  # Information about missing values per column
+        # Preview headers with data type codes and the DataFrame they were built for
+        self._column_headers_df: Optional[pd.DataFrame] = None
+        self._column_headers: list[str] = []
+        # Results of apply_all per source DataFrame id: (source, transformations, result);
+        # the source is kept so its id cannot be reused while the entry exists
+        self._transform_cache: Dict[int, tuple[pd.DataFrame, tuple, pd.DataFrame]] = {}
+
+        # Missing values are counted on a pool thread; only the result of the
+        # latest request is shown
+        self._missing_values_seq = 0
+        self._missing_values_key: tuple = ()
+        self._missing_values_options: Dict[str, Any] = {}
+        self._missing_values_worker: Optional[_MissingValuesWorker] = None
 
         # Transformer for data cleaning and conversion
         self.data_transformer = DataFrameTransformer()
@@ -338,9 +482,14 @@ class CSVImportDialogWithTransformation(QDialog):
         preview_group = QGroupBox("Vorschau der transformierten Daten")
         preview_inner_layout = QVBoxLayout(preview_group)
 
-        # Preview table
-        self.preview_table = QTableWidget()
+        # Preview table; cell text and colors are only created for visible cells
+        self.preview_model = MissingValueTableModel(self)
+        self.preview_table = QTableView()
+        self.preview_table.setModel(self.preview_model)
         self.preview_table.setAlternatingRowColors(True)
+        # Fixed section sizes, so layout does not depend on the cell contents
+        self.preview_table.verticalHeader().setDefaultSectionSize(22)
+        self.preview_table.horizontalHeader().setDefaultSectionSize(120)
         preview_inner_layout.addWidget(self.preview_table)
 
         # Data type legend
@@ -365,6 +514,12 @@ class CSVImportDialogWithTransformation(QDialog):
             legend_layout.addWidget(legend_item)
 
         legend_layout.addStretch()
+
+        # Fitting all columns measures every row, so it is only done on request
+        fit_columns_button = QPushButton("Spalten anpassen")
+        _ = fit_columns_button.clicked.connect(self.preview_table.resizeColumnsToContents)
+        legend_layout.addWidget(fit_columns_button)
+
         preview_inner_layout.addLayout(legend_layout)
 
         preview_layout.addWidget(preview_group)
@@ -375,73 +530,109 @@ class CSVImportDialogWithTransformation(QDialog):
 
     def on_option_changed(self) -> None:
         """Handle changes to import options."""
-        # Update import options
-        self.import_options['delimiter'] = self.delimiter_combo.currentText()
+        # Update import options; the tab character is offered as '\\t'
+        delimiter = self.delimiter_combo.currentText()
+        self.import_options['delimiter'] = _DELIMITER_ALIASES.get(delimiter, delimiter)
         self.import_options['encoding'] = self.encoding_combo.currentText()
         self.import_options['has_header'] = self.header_check.isChecked()
         self.import_options['skip_rows'] = self.skip_rows_spin.value()
         self.import_options['decimal'] = self.decimal_combo.currentText()
         self.import_options['thousands'] = self.thousands_combo.currentText()
 
-        # Special handling for tab character
-        if self.import_options['delimiter'] == '\\t':
-            self.import_options['delimiter'] = '\t'
-
     def update_preview(self) -> None:
         """Update the preview table with current options."""
         self.on_option_changed()  # Ensure options are up to date
 
+        if self.full_df is not None and self._read_csv_options() == self._full_df_options:
+            # The complete dataset was read with the same options, so the preview
+            # is its first rows and the file does not have to be parsed again
+            self.preview_df = self.full_df.head(self.PREVIEW_ROWS)
+            self._transform_cache = {
+                key: entry for key, entry in self._transform_cache.items() if entry[0] is self.full_df
+            }
+            self.update_transformation_preview()
+            return
+
         # Get preview data
         preview_df, error = CSVImporter.get_preview(
             self.file_path,
             delimiter=str(self.import_options['delimiter']),
             encoding=str(self.import_options['encoding']),
             has_header=bool(self.import_options['has_header']),
-            skip_rows=int(self.import_options['skip_rows'])
+            skip_rows=int(self.import_options['skip_rows']),
+            preview_rows=self.PREVIEW_ROWS
         )
 
         if error:
             # Show error in preview table
-            self.preview_table.setRowCount(1)
-            self.preview_table.setColumnCount(1)
-            self.preview_table.setItem(0, 0, QTableWidgetItem(error))
+            self.preview_model.set_dataframe(pd.DataFrame({"Fehler": [error]}))
             return
 
         self.preview_df = preview_df
+        # A complete dataset read with the previous options is outdated
+        self.full_df = None
+        self._transform_cache.clear()
 
         if preview_df is None:
             return
 
-        # Lade den vollständigen Datensatz für die Statistiken und für den späteren Import
-        self.load_full_dataset()
-
         # Since we've removed tabs, always show the transformed preview
         self.update_transformation_preview()
 
-    def load_full_dataset(self) -> None:
-        """Loads the complete dataset for calculating statistics and for later import."""
-        try:
-            # Determine header row setting
-            header = 0 if self.import_options['has_header'] else None
+    def _read_csv_options(self) -> Dict[str, Any]:
+        """Keyword arguments for pd.read_csv from the current import options."""
+        return {
+            'delimiter': str(self.import_options['delimiter']),
+            'encoding': str(self.import_options['encoding']),
+            'header': 0 if self.import_options['has_header'] else None,
+            'skiprows': int(self.import_options['skip_rows']),
+            'decimal': str(self.import_options['decimal']),
+            'thousands': str(self.import_options['thousands'])
+        }
 
-            # Read the entire CSV file
-            self.full_df = pd.read_csv(
-                self.file_path,
-                delimiter=str(self.import_options['delimiter']),
-                encoding=str(self.import_options['encoding']),
-                header=header,
-                skiprows=int(self.import_options['skip_rows']),
-                decimal=str(self.import_options['decimal']),
-                thousands=str(self.import_options['thousands'])
-            )
+    def load_full_dataset(self) -> Optional[str]:
+        """Loads the complete dataset for the import.
 
-            # If no header is present, rename the columns
-            if not self.import_options['has_header']:
-                self.full_df.columns = [f"Spalte_{i+1}" for i in range(len(self.full_df.columns))]
+        Returns:
+            Error message if the file could not be read, otherwise None
+        """
+        try:
+            # Read the entire CSV file
+            read_options = self._read_csv_options()
+            self.full_df = pd.read_csv(self.file_path, **read_options)
+            _name_columns(self.full_df, bool(self.import_options['has_header']))
+            self._full_df_options = read_options
 
         except Exception as e:
-            print(f"Error loading the complete dataset: {e}")
+            logger.exception("Error loading the complete dataset")
             self.full_df = None
+            return str(e)
+        return None
+
+    def _transformations_key(self) -> tuple:
+        """Hashable description of the current transformation list, including parameters."""
+        return tuple(
+            (t.column, t.operation, repr(sorted(t.parameters.items())))
+            for t in self.data_transformer.transformations
+        )
+
+    def _apply_all_cached(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply all transformations, reusing the result while data and transformations are unchanged.
+
+        Args:
+            df: Source DataFrame (the preview or the complete dataset)
+
+        Returns:
+            The transformed DataFrame; callers must not modify it
+        """
+        key = self._transformations_key()
+        cached = self._transform_cache.get(id(df))
+        if cached is not None and cached[0] is df and cached[1] == key:
+            return cached[2]
+
+        result = self.data_transformer.apply_all(df)
+        self._transform_cache[id(df)] = (df, key, result)
+        return result
 
     def get_data_type_code(self, column_data) -> str:
         """Get a single character code representing the data type of a column.
@@ -452,55 +643,38 @@ class CSVImportDialogWithTransformation(QDialog):
         Returns:
             A single character representing the data type
         """
-        if pd.api.types.is_integer_dtype(column_data):
-            return "i"  # Integer
-        elif pd.api.types.is_float_dtype(column_data):
-            return "f"  # Float
-        elif pd.api.types.is_datetime64_any_dtype(column_data):
-            return "d"  # Date
-        elif pd.api.types.is_bool_dtype(column_data):
-            return "b"  # Boolean
-        elif hasattr(column_data, 'cat') or str(column_data.dtype) == 'category':
+        # Integer, float, date and boolean columns (NumPy and nullable) by dtype kind
+        code = _KIND_CODES.get(column_data.dtype.kind)
+        if code is not None:
+            return code
+        elif isinstance(column_data.dtype, pd.CategoricalDtype):
             return "c"  # Category
         elif pd.api.types.is_string_dtype(column_data) or pd.api.types.is_object_dtype(column_data):
-            # Check if it's truly a string or mixed
-            if column_data.apply(lambda x: isinstance(x, str)).all():
+            # Check if it's truly a string or mixed; infer_dtype stops at the
+            # first non-string value, missing values count as non-strings
+            if infer_dtype(column_data, skipna=False) in ('string', 'empty') and not column_data.hasnans:
                 return "s"  # String
             else:
                 return "?"  # Mixed/Unknown
         else:
             return "?"  # Unknown
 
-    def calculate_missing_values(self) -> Dict[str, Dict[str, Any]]:
-        """Calculates the missing values for each column in the complete dataset.
+    def _build_missing_values_info(self, null_counts: pd.Series, total_count: int) -> Dict[str, Dict[str, Any]]:
+        """Builds the information about missing values for each column.
+
+        Args:
+            null_counts: Number of missing values per column
+            total_count: Number of rows
 
         Returns:
             Dictionary with column name as key and information about missing values
         """
         missing_values_info = {}
 
-        # If no complete dataset is available, use the preview
-        df_to_use = self.full_df if self.full_df is not None else self.transformed_df
-
-        if df_to_use is None:
-            return missing_values_info
-
-        # Apply transformations to the complete dataset
-        if self.full_df is not None:
-            transformed_full_df = self.data_transformer.apply_all(self.full_df)
-        else:
-            transformed_full_df = self.transformed_df
-
-        # Ensure that transformed_full_df is not None
-        if transformed_full_df is None:
-            return missing_values_info
-
-        # Calculate missing values for each column
-        for col in transformed_full_df.columns:
-            # Number of missing values
-            null_count = transformed_full_df[col].isna().sum()
-            # Total number of values
-            total_count = len(transformed_full_df)
+        # Calculate missing values for each column; the counts were taken for
+        # the whole frame at once, so this only builds the dictionary
+        for col, null_count in zip(null_counts.index, null_counts.to_numpy().tolist()):
+            null_count = int(null_count)
             # Percentage of missing values
             null_percent = (null_count / total_count) * 100 if total_count > 0 else 0
 
@@ -513,54 +687,109 @@ class CSVImportDialogWithTransformation(QDialog):
         return missing_values_info
 
     def update_missing_values_info(self) -> None:
-        """Updates the table with information about missing values."""
-        # Calculate missing values
-        self.missing_values_info = self.calculate_missing_values()
+        """Starts counting the missing values of the complete dataset in the background."""
+        self._missing_values_seq += 1
+
+        if self.preview_df is None:
+            # Clear the table if no information is available
+            self.missing_values_info = {}
+            self.missing_values_table.setRowCount(0)
+            return
+
+        # The worker gets its own transformation list, so edits in the dialog
+        # do not change the list while it is being applied
+        transformer = DataFrameTransformer()
+        for transformation in self.data_transformer.transformations:
+            transformer.add_transformation(transformation)
+        self._missing_values_key = self._transformations_key()
+        self._missing_values_options = self._read_csv_options()
+
+        worker = _MissingValuesWorker(
+            self._missing_values_seq, self.file_path, self._missing_values_options,
+            bool(self.import_options['has_header']), transformer, self.full_df,
+            self.MISSING_VALUES_CHUNK_ROWS
+        )
+        _ = worker.signals.finished.connect(self._apply_missing_values)
+        self._missing_values_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _apply_missing_values(self, seq: int, null_counts: Optional[pd.Series], total_count: int,
+                              full_df: Optional[pd.DataFrame],
+                              transformed_full_df: Optional[pd.DataFrame]) -> None:
+        """Shows missing values counted in the background, unless a newer count was requested.
+
+        Args:
+            seq: Sequence number of the request the result belongs to
+            null_counts: Missing values per column (None if error)
+            total_count: Number of rows
+            full_df: Complete dataset, if the worker loaded it
+            transformed_full_df: Transformed complete dataset, if the worker loaded it
+        """
+        if seq != self._missing_values_seq:
+            return
+
+        # Keep a complete dataset the worker had to load for the import
+        if full_df is not None and transformed_full_df is not None:
+            if self.full_df is None:
+                self.full_df = full_df
+                self._full_df_options = self._missing_values_options
+            if full_df is self.full_df:
+                self._transform_cache[id(full_df)] = (full_df, self._missing_values_key, transformed_full_df)
+
+        # Fall back to the transformed preview if the file could not be read
+        if null_counts is None:
+            if self.transformed_df is None:
+                self.missing_values_info = {}
+                self.missing_values_table.setRowCount(0)
+                return
+            null_counts = self.transformed_df.isna().sum()
+            total_count = len(self.transformed_df)
+
+        self.missing_values_info = self._build_missing_values_info(null_counts, total_count)
 
         if not self.missing_values_info:
             # Clear the table if no information is available
             self.missing_values_table.setRowCount(0)
             return
 
-        # Update the table
-        self.missing_values_table.setRowCount(len(self.missing_values_info))
+        # Update the table; repainting, sorting and the table's signals wait
+        # until all items are set
+        table = self.missing_values_table
+        sorting_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        signals_blocked = table.blockSignals(True)
+        try:
+            table.setRowCount(len(self.missing_values_info))
 
-        # Fill the table with data
-        for row, (col_name, info) in enumerate(self.missing_values_info.items()):
-            # Column name
-            self.missing_values_table.setItem(row, 0, QTableWidgetItem(col_name))
+            # Fill the table with data
+            for row, (col_name, info) in enumerate(self.missing_values_info.items()):
+                # Number of missing values
+                count_item = QTableWidgetItem(f"{info['count']} / {info['total']}")
 
-            # Number of missing values
-            count_item = QTableWidgetItem(f"{info['count']} / {info['total']}")
-            self.missing_values_table.setItem(row, 1, count_item)
+                # Percentage of missing values
+                percent_item = QTableWidgetItem(f"{info['percent']:.2f}%")
 
-            # Percentage of missing values
-            percent_item = QTableWidgetItem(f"{info['percent']:.2f}%")
-            self.missing_values_table.setItem(row, 2, percent_item)
+                # Color only the "Missing Values" and "Percent" cells dark red if missing values are present
+                if info['count'] > 0:
+                    for item in (count_item, percent_item):
+                        item.setBackground(MissingValueTableModel.MISSING_BACKGROUND)
+                        item.setForeground(MissingValueTableModel.MISSING_FOREGROUND)
 
-            # Color only the "Missing Values" and "Percent" cells dark red if missing values are present
-            if info['count'] > 0:
-                # Only color columns 1 (Missing Values) and 2 (Percent)
-                for col in range(1, 3):
-                    item = self.missing_values_table.item(row, col)
-                    if item:
-                        item.setBackground(QBrush(QColor(180, 0, 0)))  # Dark red
-                        item.setForeground(QBrush(QColor(255, 255, 255)))  # White text for better contrast
+                # Column name
+                table.setItem(row, 0, QTableWidgetItem(str(col_name)))
+                table.setItem(row, 1, count_item)
+                table.setItem(row, 2, percent_item)
+        finally:
+            _ = table.blockSignals(signals_blocked)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting_enabled)
 
-        # Adjust column width to content
-        self.missing_values_table.resizeColumnsToContents()
+        # Column widths follow the resize modes set up in setup_preview_section
 
         # Force the table to update its layout and use the full width
         self.missing_values_table.updateGeometry()
 
-        # Ensure the header is properly configured
-        header = self.missing_values_table.horizontalHeader()
-        if header:
-            header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-            header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-            header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-            header.setStretchLastSection(True)
-
     def update_transformation_preview(self) -> None:
         """Updates the preview of the transformed data."""
         if self.preview_df is None:
@@ -568,35 +797,21 @@ class CSVImportDialogWithTransformation(QDialog):
 
         # If no transformations have been applied yet, show the original data
         if self.transformed_df is None:
-            self.transformed_df = self.data_transformer.apply_all(self.preview_df)
-
-        # Update the table
-        self.preview_table.setRowCount(len(self.transformed_df))
-        self.preview_table.setColumnCount(len(self.transformed_df.columns))
-
-        # Set headers with data type
-        column_headers = []
-        for col in self.transformed_df.columns:
-            data_type = self.get_data_type_code(self.transformed_df[col])
-            column_headers.append(f"{col} [{data_type}]")
-
-        self.preview_table.setHorizontalHeaderLabels(column_headers)
-
-        # Fill data
-        for row in range(len(self.transformed_df)):
-            for col in range(len(self.transformed_df.columns)):
-                value = self.transformed_df.iloc[row, col]
-                item = QTableWidgetItem(str(value))
-
-                # Mark missing values in dark red
-                if pd.isna(value):
-                    item.setBackground(QBrush(QColor(180, 0, 0)))  # Dark red
-                    item.setForeground(QBrush(QColor(255, 255, 255)))  # White text for better contrast
-
-                self.preview_table.setItem(row, col, item)
-
-        # Adjust column width to content
-        self.preview_table.resizeColumnsToContents()
+            self.transformed_df = self._apply_all_cached(self.preview_df)
+
+        # Set headers with data type; they are only built again once the
+        # transformed data has been replaced
+        if self._column_headers_df is not self.transformed_df:
+            self._column_headers_df = self.transformed_df
+            self._column_headers = [
+                f"{col} [{self.get_data_type_code(self.transformed_df[col])}]"
+                for col in self.transformed_df.columns
+            ]
+
+        # Update the table unless it already shows this data; the model marks
+        # missing values in dark red
+        if self.preview_model.dataframe is not self.transformed_df:
+            self.preview_model.set_dataframe(self.transformed_df, self._column_headers)
 
         # Update the missing values information
         self.update_missing_values_info()
@@ -1163,7 +1378,7 @@ class CSVImportDialogWithTransformation(QDialog):
         """Applies all transformations to the preview data."""
         if self.preview_df is not None:
             # Apply transformations to the preview data
-            self.transformed_df = self.data_transformer.apply_all(self.preview_df)
+            self.transformed_df = self._apply_all_cached(self.preview_df)
 
             # Update the preview
             self.update_transformation_preview()
@@ -1176,11 +1391,26 @@ class CSVImportDialogWithTransformation(QDialog):
         # Then apply transformations if we have data
         if self.preview_df is not None:
             # Apply all transformations to the preview data
-            self.transformed_df = self.data_transformer.apply_all(self.preview_df)
+            self.transformed_df = self._apply_all_cached(self.preview_df)
 
             # Update the preview
             self.update_transformation_preview()
 
+    @override
+    def accept(self) -> None:
+        """Load the complete dataset for the import and close the dialog."""
+        if self.full_df is None:
+            error = self.load_full_dataset()
+            if error is not None:
+                # Keep the dialog open instead of importing only the preview rows
+                _ = QMessageBox.critical(
+                    self,
+                    "Fehler beim Laden",
+                    f"Die Datei konnte nicht vollständig geladen werden:\n{error}"
+                )
+                return
+        super().accept()
+
     def get_import_options(self) -> Dict[str, Any]:
         """Get the current import options.
 
@@ -1199,7 +1429,7 @@ class CSVImportDialogWithTransformation(QDialog):
         """
         # Wenn der vollständige Datensatz vorhanden ist, wende die Transformationen darauf an
         if self.full_df is not None:
-            return self.data_transformer.apply_all(self.full_df)
+            return self._apply_all_cached(self.full_df)
 
         # Ansonsten gib die transformierte Vorschau zurück
         return self.transformed_df
@@ -11,7 +11,7 @@ from PyQt6.QtGui import QIntValidator
 from PyQt6.QtCore import Qt
 
 from src.data.models import DataSource, Visualization
-from src.config import VISUALIZATION_TYPES, VISUALIZATION_COLORS
+from src.config import visualization_types, visualization_colors
 from src.gui.widgets.chart_view import ChartView
 
 
@@ -145,7 +145,7 @@ class VisualizationCreationDialog(QDialog):
 
         # Add each chart type as a selectable option
         self.chart_type_buttons = {}
-        for chart_type, chart_info in VISUALIZATION_TYPES.items():
+        for chart_type, chart_info in visualization_types().items():
             chart_button = QPushButton(f"{chart_info['icon']} {chart_info['name']}")
             chart_button.setCheckable(True)
             _ = chart_button.setProperty("chart_type", chart_type)
@@ -319,14 +319,15 @@ class VisualizationCreationDialog(QDialog):
         y_axis_combo.addItems(self.column_names)
 
         # Color selection - use different default colors based on the index
+        colors = visualization_colors()
         default_colors = [
-            VISUALIZATION_COLORS['Blau']['mittel'],    # First Y-axis: Blue
-            VISUALIZATION_COLORS['Rot']['mittel'],     # Second Y-axis: Red
-            VISUALIZATION_COLORS['Grün']['mittel'],    # Third Y-axis: Green
-            VISUALIZATION_COLORS['Gelb']['mittel'],    # Fourth Y-axis: Yellow
-            VISUALIZATION_COLORS['Orange']['mittel'],  # Fifth Y-axis: Orange
-            VISUALIZATION_COLORS['Lila']['mittel'],    # Sixth Y-axis: Purple
-            VISUALIZATION_COLORS['Grau']['mittel']     # Seventh Y-axis: Gray
+            colors['Blau']['mittel'],    # First Y-axis: Blue
+            colors['Rot']['mittel'],     # Second Y-axis: Red
+            colors['Grün']['mittel'],    # Third Y-axis: Green
+            colors['Gelb']['mittel'],    # Fourth Y-axis: Yellow
+            colors['Orange']['mittel'],  # Fifth Y-axis: Orange
+            colors['Lila']['mittel'],    # Sixth Y-axis: Purple
+            colors['Grau']['mittel']     # Seventh Y-axis: Gray
         ]
 
         # Choose a default color based on the number of existing widgets
@@ -436,7 +437,7 @@ class VisualizationCreationDialog(QDialog):
         color_grid = QVBoxLayout()
 
         # Add each color group
-        for color_group, shades in VISUALIZATION_COLORS.items():
+        for color_group, shades in visualization_colors().items():
             group_layout = QHBoxLayout()
             group_layout.addWidget(QLabel(f"{color_group}:"))
 
@@ -1341,12 +1342,12 @@ class VisualizationCreationDialog(QDialog):
                     chart_type, x_axis, len(y_axes))
 
         # Check if chart type supports multiple Y-axes
-        chart_info = VISUALIZATION_TYPES.get(str(chart_type), {})
+        chart_info = visualization_types().get(str(chart_type), {})
         supports_multiple_y = bool(chart_info.get('supports_multiple_y', False))
 
         # If we have multiple Y-axes but the chart type doesn't support it, show warning
         if len(y_axes) > 1 and not supports_multiple_y:
-            chart_name = VISUALIZATION_TYPES.get(str(chart_type), {}).get('name', str(chart_type))
+            chart_name = visualization_types().get(str(chart_type), {}).get('name', str(chart_type))
             warning_label = QLabel(f"Achtung: {chart_name} unterstützt nur eine Y-Achse. "
                                   "Nur die erste ausgewählte Y-Achse wird verwendet.")
             warning_label.setStyleSheet("color: #FFD700;")  # Gold color for warning
@@ -1523,7 +1524,7 @@ class VisualizationCreationDialog(QDialog):
 
         # Check if chart type supports multiple Y-axes
         chart_type = str(self.visualization_config['chart_type'])
-        chart_info = VISUALIZATION_TYPES.get(chart_type, {})
+        chart_info = visualization_types().get(chart_type, {})
         supports_multiple_y = bool(chart_info.get('supports_multiple_y', False))
 
         if len(self.visualization_config['y_axes']) > 1 and not supports_multiple_y:
@@ -1655,7 +1656,7 @@ class VisualizationCreationDialog(QDialog):
 
         # Check if chart type supports multiple Y-axes
         chart_type = str(self.visualization_config['chart_type'])
-        chart_info = VISUALIZATION_TYPES.get(chart_type, {})
+        chart_info = visualization_types().get(chart_type, {})
         supports_multiple_y = bool(chart_info.get('supports_multiple_y', False))
 
         # If chart doesn't support multiple Y-axes, only use the first one
@@ -0,0 +1,132 @@
+"""Table models for showing pandas DataFrames in Qt item views."""
+from typing import Any, Optional, override
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+from PyQt6.QtGui import QBrush, QColor
+
+import numpy as np
+import pandas as pd
+
+
+def _cell_values(column: pd.Series) -> Any:
+    """Positional cell values of a column, indexable without pandas' scalar indexers.
+
+    NumPy-backed columns give their ndarray (no copy); datetime, timedelta and
+    extension columns give their pandas array, whose items print like iat's.
+    """
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind not in 'mM':
+        return column.to_numpy()
+    return column.array
+
+
+class DataFrameTableModel(QAbstractTableModel):
+    """Read-only model exposing a DataFrame to a QTableView.
+
+    Cell text is created in data() when the view asks for it, so only the
+    visible cells are converted to strings.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize the model with an empty DataFrame.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._df = pd.DataFrame()
+        self._columns: list[Any] = []
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """The DataFrame currently shown."""
+        return self._df
+
+    def set_dataframe(self, df: pd.DataFrame) -> None:
+        """Replace the shown DataFrame and reset attached views.
+
+        Args:
+            df: DataFrame to show
+        """
+        self.beginResetModel()
+        self._df = df
+        self._columns = [_cell_values(df.iloc[:, i]) for i in range(len(df.columns))]
+        self.endResetModel()
+
+    @override
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of rows; table models have no children."""
+        return 0 if parent.isValid() else len(self._df)
+
+    @override
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of columns; table models have no children."""
+        return 0 if parent.isValid() else len(self._df.columns)
+
+    @override
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Text of a cell for the display role."""
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return str(self._columns[index.column()][index.row()])
+
+    @override
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Column names as horizontal and 1-based row numbers as vertical headers."""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self._df.columns[section])
+        return str(section + 1)
+
+
+class MissingValueTableModel(DataFrameTableModel):
+    """DataFrame model that marks missing cells and accepts custom column labels."""
+
+    # Missing cells are shown as white text on dark red
+    MISSING_BACKGROUND = QBrush(QColor(180, 0, 0))
+    MISSING_FOREGROUND = QBrush(QColor(255, 255, 255))
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize the model with an empty DataFrame.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._missing = np.zeros((0, 0), dtype=bool)
+        self._column_labels: Optional[list[str]] = None
+
+    @override
+    def set_dataframe(self, df: pd.DataFrame, column_labels: Optional[list[str]] = None) -> None:
+        """Replace the shown DataFrame and reset attached views.
+
+        Args:
+            df: DataFrame to show
+            column_labels: Horizontal header labels (column names if None)
+        """
+        # Computed before the reset, so views never see a mask of the wrong shape
+        self._missing = df.isna().to_numpy()
+        self._column_labels = column_labels
+        super().set_dataframe(df)
+
+    @override
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Text of a cell, plus colors for missing cells."""
+        if role == Qt.ItemDataRole.DisplayRole:
+            return super().data(index, role)
+        if role not in (Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ForegroundRole):
+            return None
+        if not index.isValid() or not self._missing[index.row(), index.column()]:
+            return None
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.MISSING_BACKGROUND
+        return self.MISSING_FOREGROUND
+
+    @override
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Custom column labels if given, otherwise the default headers."""
+        if (role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal
+                and self._column_labels is not None):
+            return self._column_labels[section]
+        return super().headerData(section, orientation, role)
@@ -14,7 +14,7 @@ from src.gui.widgets.data_preview import DataPreviewWidget
 from src.gui.widgets.visualization_view import VisualizationView
 from src.gui.widgets.visualization_display import VisualizationDisplay
 from src.gui.dialogs.visualization_creation_dialog import VisualizationCreationDialog
-from src.config import UI_COLORS, VISUALIZATION_TYPES
+from src.config import UI_COLORS, visualization_types
 
 
 class VisualizationPlaceholder(QWidget):
@@ -70,7 +70,7 @@ class VisualizationPlaceholder(QWidget):
         types_layout.addWidget(types_label)
 
         # Add each visualization type
-        for vis_type, vis_info in VISUALIZATION_TYPES.items():
+        for vis_type, vis_info in visualization_types().items():
             type_layout = QHBoxLayout()
             type_layout.setContentsMargins(0, 0, 0, 0)
             type_layout.setSpacing(4)
@@ -0,0 +1,166 @@
+"""Tests for the missing values count of the CSV import dialog with transformations."""
+import unittest
+import tempfile
+from pathlib import Path
+from typing import override
+from unittest import mock
+
+import pandas as pd
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QApplication, QDialog
+
+# The main window has to be imported first to resolve the dialogs' import cycle
+import src.gui.main_window
+from src.data.transformations.data_transformation import (
+    TransformationOperation, DataTransformation, DataFrameTransformer
+)
+from src.gui.dialogs.csv_import_with_transform_dialog import (
+    CSVImportDialogWithTransformation, _MissingValuesWorker, _count_missing_values
+)
+from src.gui.table_model import MissingValueTableModel
+
+
+class TestCountMissingValues(unittest.TestCase):
+    """Test cases for counting missing values chunk by chunk or on the whole file."""
+
+    @override
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self.temp_dir.name) / "mixed.csv"
+        # The first chunk of the mixed column parses as integers, the file as text
+        _ = self.csv_path.write_text(
+            "mixed,value\n1,1\n2,\n3,3\n4,4\n2021-01-05,5\n2021-02-03,\nx,7\n,8\n"
+        )
+        self.read_options = {'sep': ','}
+
+    @override
+    def tearDown(self) -> None:
+        """Tear down test fixtures."""
+        self.temp_dir.cleanup()
+
+    def _counts(self, transformations: list[DataTransformation], chunk_rows: int) -> tuple[pd.Series, int]:
+        """Count the missing values of the test file after the transformations."""
+        transformer = DataFrameTransformer()
+        for transformation in transformations:
+            transformer.add_transformation(transformation)
+        null_counts, total_count, _, _ = _count_missing_values(
+            self.csv_path, self.read_options, True, transformer, None, chunk_rows
+        )
+        return null_counts, total_count
+
+    def test_chunked_counts_match_whole_file(self) -> None:
+        """Test that small chunks give the same counts as reading the whole file."""
+        cases = [
+            [],
+            [DataTransformation('value', TransformationOperation.REMOVE_MISSING)],
+            [DataTransformation('value', TransformationOperation.REPLACE_CUSTOM, {'value': 0})],
+            [DataTransformation('mixed', TransformationOperation.CONVERT_TO_DATE)],
+            [DataTransformation('mixed', TransformationOperation.TEXT_UPPERCASE),
+             DataTransformation('mixed', TransformationOperation.CONVERT_TO_NUMERIC)],
+        ]
+        for transformations in cases:
+            with self.subTest(operations=[t.operation.name for t in transformations]):
+                chunked_counts, chunked_total = self._counts(transformations, 4)
+                whole_counts, whole_total = self._counts(transformations, 100)
+                pd.testing.assert_series_equal(chunked_counts, whole_counts, check_dtype=False)
+                self.assertEqual(chunked_total, whole_total)
+
+    def test_date_conversion_of_mixed_column(self) -> None:
+        """Test that dates are converted with the dtype of the whole column."""
+        null_counts, total_count = self._counts(
+            [DataTransformation('mixed', TransformationOperation.CONVERT_TO_DATE)], 4
+        )
+        self.assertEqual(total_count, 8)
+        # Only the two dates parse once the column is read as text
+        self.assertEqual(null_counts['mixed'], 6)
+
+
+class TestMissingValuesWorker(unittest.TestCase):
+    """Test cases for the background worker counting missing values."""
+
+    def test_failure_reports_empty_result(self) -> None:
+        """Test that a failed count is logged and still reported to the dialog."""
+        worker = _MissingValuesWorker(
+            7, Path("does_not_exist.csv"), {'sep': ','}, True,
+            DataFrameTransformer(), None, 100
+        )
+        results = []
+        _ = worker.signals.finished.connect(lambda *args: results.append(args))
+
+        with self.assertLogs('src.gui.dialogs.csv_import_with_transform_dialog', level='ERROR') as logs:
+            worker.run()
+
+        self.assertEqual(results, [(7, None, 0, None, None)])
+        self.assertIn("Error counting missing values", logs.output[0])
+
+
+class TestImportDialog(unittest.TestCase):
+    """Test cases for the import dialog."""
+
+    @classmethod
+    @override
+    def setUpClass(cls) -> None:
+        """Create the application the dialog needs."""
+        cls.app = QApplication.instance() or QApplication([])
+
+    @override
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self.temp_dir.name) / "data.csv"
+        _ = self.csv_path.write_text("a,b\n1,x\n2,y\n")
+        self.dialog = CSVImportDialogWithTransformation(self.csv_path)
+        QThreadPool.globalInstance().waitForDone()
+        self.dialog.full_df = None
+
+    @override
+    def tearDown(self) -> None:
+        """Tear down test fixtures."""
+        self.dialog.deleteLater()
+        self.temp_dir.cleanup()
+
+    def test_load_failure_keeps_dialog_open(self) -> None:
+        """Test that a failed full load is reported instead of importing the preview."""
+        module = 'src.gui.dialogs.csv_import_with_transform_dialog'
+        with mock.patch(f'{module}.pd.read_csv', side_effect=OSError("disk error")), \
+                mock.patch(f'{module}.QMessageBox.critical') as critical, \
+                self.assertLogs(module, level='ERROR') as logs:
+            self.dialog.accept()
+
+        critical.assert_called_once()
+        self.assertIn("disk error", critical.call_args.args[2])
+        self.assertNotEqual(self.dialog.result(), QDialog.DialogCode.Accepted)
+        self.assertIn("Error loading the complete dataset", logs.output[0])
+
+    def test_accept_loads_complete_dataset(self) -> None:
+        """Test that accepting loads the complete dataset."""
+        self.dialog.accept()
+
+        self.assertEqual(self.dialog.result(), QDialog.DialogCode.Accepted)
+        transformed = self.dialog.get_transformed_data()
+        self.assertIsNotNone(transformed)
+        if transformed is not None:
+            self.assertEqual(len(transformed), 2)
+
+    def test_missing_values_table_fill(self) -> None:
+        """Test that the missing values table is filled without item signals."""
+        table = self.dialog.missing_values_table
+        changes = []
+        _ = table.itemChanged.connect(changes.append)
+
+        self.dialog._apply_missing_values(  # pylint: disable=protected-access
+            self.dialog._missing_values_seq, pd.Series({'a': 0, 'b': 1}), 2, None, None)
+
+        self.assertEqual(table.rowCount(), 2)
+        self.assertEqual(changes, [])
+        self.assertFalse(table.signalsBlocked())
+        missing_item = table.item(1, 1)
+        self.assertIsNotNone(missing_item)
+        if missing_item:
+            self.assertEqual(missing_item.text(), "1 / 2")
+            self.assertEqual(missing_item.background(), MissingValueTableModel.MISSING_BACKGROUND)
+
+
+if __name__ == '__main__':
+    unittest.main()
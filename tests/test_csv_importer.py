@@ -6,10 +6,12 @@ import os
 import sys
 import pandas as pd
 from typing import override
+from unittest import mock
 
 # Add parent directory to path to allow imports from src
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from src.data.importers import csv_importer
 from src.data.importers.csv_importer import CSVImporter
 from src.data.models import DataSource
 
@@ -121,6 +123,63 @@ class TestCSVImporter(unittest.TestCase):
                 # Column names should be in the format "Spalte_X" when no header is present
                 self.assertTrue(all(str(col).startswith("Spalte_") for col in dataset.data.columns))
 
+    def test_import_file_without_thousands_separator(self):
+        """Test CSV import without thousands separator."""
+        data_source, error = CSVImporter.import_file(self.csv_path, thousands='')
+
+        self.assertIsNone(error)
+        self.assertIsNotNone(data_source)
+
+        if data_source and data_source.dataset:
+            pd.testing.assert_frame_equal(data_source.dataset.data, self.test_data)
+
+    def test_import_file_reuses_complete_preview(self):
+        """Test that a full import reuses a preview that covered the whole file."""
+        data_source, error = CSVImporter.import_file(self.csv_path, preview_only=True)
+        self.assertIsNone(data_source)
+        self.assertIsNone(error)
+
+        # The file has fewer rows than the preview, so it must not be parsed again
+        with mock.patch("src.data.importers.csv_importer.pd.read_csv", side_effect=AssertionError("parsed twice")):
+            data_source, error = CSVImporter.import_file(self.csv_path)
+
+        self.assertIsNone(error)
+        if data_source and data_source.dataset:
+            pd.testing.assert_frame_equal(data_source.dataset.data, self.test_data)
+
+    def test_import_file_ignores_preview_of_changed_file(self):
+        """Test that a remembered preview is not used once the file size changes."""
+        _ = CSVImporter.import_file(self.csv_path, preview_only=True)
+
+        # Same modification time, different contents and size
+        stat = os.stat(self.csv_path)
+        changed = pd.concat([self.test_data, self.test_data], ignore_index=True)
+        changed.to_csv(self.csv_path, index=False)
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        data_source, error = CSVImporter.import_file(self.csv_path)
+
+        self.assertIsNone(error)
+        if data_source and data_source.dataset:
+            pd.testing.assert_frame_equal(data_source.dataset.data, changed)
+
+    def test_complete_previews_are_bounded(self):
+        """Test that only the most recently used whole-file previews are kept."""
+        paths = []
+        for i in range(3):
+            path = Path(os.path.join(self.temp_dir.name, f"small_{i}.csv"))
+            self.test_data.to_csv(path, index=False)
+            paths.append(path)
+
+        with mock.patch.object(csv_importer, "_COMPLETE_PREVIEWS_MAX", 2):
+            for path in paths:
+                _ = CSVImporter.import_file(path, preview_only=True)
+
+        remembered = {key[0] for key in csv_importer._COMPLETE_PREVIEWS}
+        self.assertNotIn(paths[0], remembered)
+        self.assertIn(paths[1], remembered)
+        self.assertIn(paths[2], remembered)
+
     def test_import_empty_file(self):
         """Test importing an empty CSV file."""
         data_source, error = CSVImporter.import_file(self.csv_path_empty)
@@ -141,6 +200,35 @@ class TestCSVImporter(unittest.TestCase):
         delimiter = CSVImporter.detect_delimiter(self.csv_path_semicolon)
         self.assertEqual(delimiter, ";")
 
+    def test_detect_delimiter_ignores_quoted_delimiters(self):
+        """Test that delimiters inside quoted fields do not affect detection."""
+        csv_path_pipe = Path(os.path.join(self.temp_dir.name, "test_pipe.csv"))
+        with open(csv_path_pipe, "w") as f:
+            _ = f.write('Name|Address\n"Alice"|"Main St, 1, 12345, Town"\n"Bob"|"Side St, 2, 54321, City"\n')
+
+        delimiter = CSVImporter.detect_delimiter(csv_path_pipe)
+        self.assertEqual(delimiter, "|")
+
+    def test_detect_delimiter_inconsistent_rows(self):
+        """Test delimiter detection for rows with varying column counts."""
+        csv_path_ragged = Path(os.path.join(self.temp_dir.name, "test_ragged.csv"))
+        with open(csv_path_ragged, "w") as f:
+            _ = f.write("a;b;c\nd;e\nf;g;h;i\n")
+
+        delimiter = CSVImporter.detect_delimiter(csv_path_ragged)
+        self.assertEqual(delimiter, ";")
+
+    def test_detect_delimiter_redetects_modified_file(self):
+        """Test that a cached delimiter is detected again when the file changes."""
+        self.assertEqual(CSVImporter.detect_delimiter(self.csv_path), ",")
+
+        # Rewrite the file with another delimiter and move its modification time forward
+        self.test_data.to_csv(self.csv_path, index=False, sep=";")
+        stat = os.stat(self.csv_path)
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(CSVImporter.detect_delimiter(self.csv_path), ";")
+
     def test_get_preview(self):
         """Test preview generation."""
         preview_df, error = CSVImporter.get_preview(self.csv_path, preview_rows=2)
@@ -152,5 +240,21 @@ class TestCSVImporter(unittest.TestCase):
             self.assertEqual(len(preview_df.columns), 3)  # Should have 3 columns
 
 
+    def test_get_preview_rereads_modified_file(self):
+        """Test that a cached preview is refreshed when the file changes."""
+        preview_df, _ = CSVImporter.get_preview(self.csv_path)
+        self.assertIsNotNone(preview_df)
+
+        # Rewrite the file and move its modification time forward
+        self.test_data.assign(Age=[1, 2, 3]).to_csv(self.csv_path, index=False)
+        stat = os.stat(self.csv_path)
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        preview_df, error = CSVImporter.get_preview(self.csv_path)
+        self.assertIsNone(error)
+        if preview_df is not None:
+            self.assertEqual(preview_df["Age"].tolist(), [1, 2, 3])
+
+
 if __name__ == "__main__":
     _ = unittest.main()
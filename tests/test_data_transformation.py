@@ -2,7 +2,10 @@
 Tests for data transformation functionality.
 """
 import unittest
+import warnings
+from unittest import mock
 from typing import override
+import numpy as np
 import pandas as pd
 
 from src.data.transformations.data_transformation import (
@@ -353,6 +356,23 @@ class TestDataTransformation(unittest.TestCase):
         self.assertTrue(result.loc[2, 'values'] < result.loc[3, 'values'])
         self.assertTrue(result.loc[3, 'values'] < result.loc[4, 'values'])
 
+    def test_numeric_scaling_skips_missing_values(self) -> None:
+        """Test that normalization and standardization ignore missing values like pandas."""
+        numeric_data = pd.DataFrame({'values': [10.0, np.nan, 30.0, 50.0]})
+
+        normalized = DataTransformation(
+            column='values', operation=TransformationOperation.NUMERIC_NORMALIZE
+        ).apply(numeric_data)
+        standardized = DataTransformation(
+            column='values', operation=TransformationOperation.NUMERIC_STANDARDIZE
+        ).apply(numeric_data)
+
+        values = numeric_data['values']
+        pd.testing.assert_series_equal(
+            normalized['values'], (values - values.min()) / (values.max() - values.min()))
+        pd.testing.assert_series_equal(
+            standardized['values'], (values - values.mean()) / values.std())
+
     def test_numeric_limit_range(self) -> None:
         """Test limiting numeric values to a specified range."""
         # Create test data
@@ -441,6 +461,24 @@ class TestDataTransformation(unittest.TestCase):
         # Lower values should be unchanged or only slightly modified
         self.assertAlmostEqual(result.loc[0, 'values'], 10, delta=5)
 
+    def test_outlier_winsorize_without_downcasting_warning(self) -> None:
+        """Test that winsorizing keeps the dtype without pandas' downcasting warning."""
+        transformation = DataTransformation(
+            column='values',
+            operation=TransformationOperation.OUTLIER_WINSORIZE,
+            parameters={'lower': 0.1, 'upper': 0.9}
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', FutureWarning)
+            result = transformation.apply(pd.DataFrame({'values': [10, 20, 30, 40, 1000]}))
+
+        # A warning raised as error would leave the column untransformed
+        self.assertLess(result.loc[4, 'values'], 1000)
+        self.assertEqual(result['values'].dtype, np.int64)
+        # The option is only enabled around the clip call
+        self.assertFalse(pd.get_option('future.no_silent_downcasting'))
+
     def test_chained_transformations(self) -> None:
         """Test multiple transformations in sequence."""
         # Add two transformations
@@ -465,6 +503,68 @@ class TestDataTransformation(unittest.TestCase):
         self.assertEqual(result.loc[0, 'text'], 'A')  # Already uppercase
         self.assertEqual(result.loc[1, 'text'], 'B')
 
+    def test_apply_leaves_input_unchanged(self) -> None:
+        """Test that a single transformation does not modify the input DataFrame."""
+        original = self.test_data.copy()
+        transformation = DataTransformation(column='numeric', operation=TransformationOperation.REPLACE_MEAN)
+
+        result = transformation.apply(self.test_data)
+
+        pd.testing.assert_frame_equal(self.test_data, original)
+        self.assertEqual(result['numeric'].isna().sum(), 0)
+
+    def test_apply_all_leaves_input_unchanged(self) -> None:
+        """Test that chained transformations do not modify the input DataFrame."""
+        original = self.test_data.copy()
+        self.transformer.add_transformation(
+            DataTransformation(column='numeric', operation=TransformationOperation.REPLACE_MEAN)
+        )
+        self.transformer.add_transformation(
+            DataTransformation(column='numeric', operation=TransformationOperation.NUMERIC_ROUND)
+        )
+
+        result = self.transformer.apply_all(self.test_data)
+
+        pd.testing.assert_frame_equal(self.test_data, original)
+        self.assertEqual(result['numeric'].isna().sum(), 0)
+
+    def test_same_column_run_matches_sequential_apply(self) -> None:
+        """Test that a run of transformations on one column gives the same result as applying them one by one."""
+        transformations = [
+            DataTransformation(column='numeric', operation=TransformationOperation.REMOVE_MISSING),
+            DataTransformation(column='numeric', operation=TransformationOperation.REPLACE_MEAN),
+            DataTransformation(column='numeric', operation=TransformationOperation.NUMERIC_NORMALIZE),
+            DataTransformation(column='text', operation=TransformationOperation.TEXT_LOWERCASE),
+        ]
+        expected = self.test_data
+        for transformation in transformations:
+            self.transformer.add_transformation(transformation)
+            expected = transformation.apply(expected)
+
+        result = self.transformer.apply_all(self.test_data)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_parallel_columns_match_sequential_apply(self) -> None:
+        """Test that transforming columns in parallel gives the same result as applying one by one."""
+        transformations = [
+            DataTransformation(column='numeric', operation=TransformationOperation.REPLACE_MEAN),
+            DataTransformation(column='text', operation=TransformationOperation.TEXT_LOWERCASE),
+            DataTransformation(column='numeric', operation=TransformationOperation.NUMERIC_STANDARDIZE),
+            DataTransformation(column='with_spaces', operation=TransformationOperation.TEXT_TRIM),
+            DataTransformation(column='missing', operation=TransformationOperation.TEXT_TRIM),
+        ]
+        expected = self.test_data
+        for transformation in transformations:
+            self.transformer.add_transformation(transformation)
+            expected = transformation.apply(expected)
+
+        self.transformer.PARALLEL_MIN_ROWS = 0
+        with mock.patch('os.cpu_count', return_value=4):
+            result = self.transformer.apply_all(self.test_data)
+
+        pd.testing.assert_frame_equal(result, expected)
+
     def test_transformer_management(self) -> None:
         """Test management functions of DataFrameTransformer."""
         # Add transformations
@@ -540,6 +640,15 @@ class TestDataTransformation(unittest.TestCase):
         result = transformation.apply(self.test_data)
         self.assertEqual(result.loc[0, 'numeric'], 1)  # Unchanged
 
+        # Invalid regular expressions fail on apply, not on creation
+        transformation = DataTransformation(
+            column='text',
+            operation=TransformationOperation.TEXT_REPLACE,
+            parameters={'pattern': '(', 'replacement': 'X'}
+        )
+        result = transformation.apply(self.test_data)
+        self.assertEqual(result.loc[0, 'text'], 'A')  # Unchanged
+
     def test_get_description(self) -> None:
         """Test the get_description method."""
         # Test with no parameters
@@ -1,11 +1,16 @@
 """Tests for Dataset functionality."""
+import gc
 import unittest
+from unittest import mock
 from datetime import datetime
 import pandas as pd
 import numpy as np
 from typing import override
 
-from src.data.models import Dataset
+from src.data.models import Dataset, Column
+from src.data.transformations.data_transformation import (
+    TransformationOperation, DataTransformation, DataFrameTransformer
+)
 
 
 class TestDataset(unittest.TestCase):
@@ -127,6 +132,50 @@ class TestDataset(unittest.TestCase):
         self.assertEqual(large_dataset.metadata["rows"], 1000)
         self.assertEqual(large_dataset.metadata["columns"], 10)
 
+    def test_optimized_data_narrows_dtypes(self) -> None:
+        """Test that optimized data uses smaller, lossless dtypes while data keeps its own."""
+        rows = 10_000
+        large_df = pd.DataFrame({
+            'small_ints': np.arange(rows) % 100,
+            'halves': (np.arange(rows) % 7) * 0.5,
+            'random': np.random.rand(rows),
+            'labels': np.array(['x', 'y'])[np.arange(rows) % 2]
+        })
+
+        large_dataset = Dataset(data=large_df, metadata={})
+        optimized = large_dataset.get_optimized_data()
+
+        # Values are unchanged
+        pd.testing.assert_frame_equal(optimized, large_df, check_dtype=False,
+                                      check_categorical=False)
+        self.assertEqual(optimized['small_ints'].dtype, np.int8)
+        self.assertEqual(optimized['halves'].dtype, np.float32)
+        self.assertEqual(optimized['random'].dtype, np.float64)
+        self.assertIsInstance(optimized['labels'].dtype, pd.CategoricalDtype)
+
+        # The dataset keeps the dtypes it was given
+        pd.testing.assert_frame_equal(large_dataset.data, large_df)
+        self.assertEqual(large_dataset.get_column_types()['small_ints'], 'int64')
+
+    def test_transformations_on_large_dataset(self) -> None:
+        """Test that transformations of a large dataset see the original dtypes."""
+        rows = 10_000
+        labels = np.array(['x', 'y', None], dtype=object)[np.arange(rows) % 3]
+        large_dataset = Dataset(
+            data=pd.DataFrame({'small_ints': np.arange(rows) % 100, 'labels': labels}),
+            metadata={}
+        )
+
+        transformer = DataFrameTransformer()
+        transformer.add_transformation(DataTransformation(
+            'labels', TransformationOperation.REPLACE_CUSTOM, {'value': 'unknown'}))
+        result = transformer.apply_all(large_dataset.data)
+
+        # A value outside the existing labels would fail on a categorical column
+        self.assertEqual((result['labels'] == 'unknown').sum(), rows // 3)
+        # Arithmetic does not overflow as it would with int8
+        self.assertEqual((large_dataset.data['small_ints'] * 100).max(), 9900)
+
     def test_get_preview(self) -> None:
         """Test the get_preview method."""
         # Test with default rows
@@ -157,6 +206,21 @@ class TestDataset(unittest.TestCase):
         column_types = self.empty_dataset.get_column_types()
         self.assertEqual(len(column_types), 0)
 
+    def test_get_column_types_after_reassignment(self) -> None:
+        """Test that reassigning columns or data refreshes the cached column types."""
+        dataset = self.minimal_dataset
+        self.assertEqual(dataset.get_column_types()['text'], 'object')
+
+        # Same list object and length, so nothing but the assignment signals the change
+        columns = dataset.columns
+        columns[1] = Column(name='text', data_type='text', original_type='string')
+        dataset.columns = columns
+        self.assertEqual(dataset.get_column_types()['text'], 'string')
+
+        dataset.columns = []
+        dataset.data = pd.DataFrame({'a': [1.5], 'b': ['x']})
+        self.assertEqual(dataset.get_column_types(), {'a': 'float64', 'b': 'object'})
+
     def test_generate_metadata(self) -> None:
         """Test the generate_metadata method."""
         # Test with minimal dataset and no source info
@@ -226,6 +290,95 @@ class TestDataset(unittest.TestCase):
             self.assertEqual(numeric_column.stats['max'], 5)
             self.assertAlmostEqual(numeric_column.stats['mean'], 3.0)
 
+    def test_numeric_statistics_match_pandas(self) -> None:
+        """Test that the array-based numeric statistics agree with pandas."""
+        series = self.test_df['numeric']
+        numeric_column = self.minimal_dataset.get_column_by_name('numeric')
+        self.assertIsNotNone(numeric_column)
+        if numeric_column:
+            self.assertAlmostEqual(numeric_column.stats['median'], series.median())
+            self.assertAlmostEqual(numeric_column.stats['std'], series.std())
+
+        zeros_column = self.minimal_dataset.get_column_by_name('zeros')
+        self.assertIsNotNone(zeros_column)
+        if zeros_column:
+            self.assertEqual(zeros_column.stats['null_count'], 0)
+            self.assertEqual(zeros_column.stats['std'], 0.0)
+
+    def test_block_statistics_match_series_statistics(self) -> None:
+        """Test that columns summarized as a block match Column.from_series."""
+        data = pd.DataFrame({
+            'a': [1.5, np.nan, 3.0, 3.0, 1e9],
+            'b': [np.nan] * 5,
+            'c': [2.0, np.nan, np.nan, np.nan, np.nan],
+            'd': [4, 1, 1, 7, 2]
+        })
+        dataset = Dataset(data=data, metadata={})
+
+        for column in dataset.columns:
+            expected = Column.from_series(column.name, data[column.name]).stats
+            self.assertEqual(column.stats.keys(), expected.keys())
+            for key, value in expected.items():
+                if value is None:
+                    self.assertIsNone(column.stats[key], f"{column.name}.{key}")
+                else:
+                    self.assertAlmostEqual(column.stats[key], value, msg=f"{column.name}.{key}")
+
+    def test_long_text_column_unique_count_is_estimated(self) -> None:
+        """Test that long string columns count distinct values in a sample."""
+        series = pd.Series(['a', 'b', 'c', 'd', 'e', None])
+        with mock.patch.object(Column, 'UNIQUE_SAMPLE_ROWS', 3):
+            column = Column.from_series('letters', series)
+            mixed_column = Column.from_series('mixed', self.test_df['mixed'])
+
+        self.assertEqual(column.stats['unique_count'], 3)
+        self.assertEqual(column.stats['count'], 5)
+        self.assertTrue(column.metadata['nunique_estimated'])
+
+        # Mixed object columns are still counted exactly
+        self.assertEqual(mixed_column.stats['unique_count'], 4)
+        self.assertNotIn('nunique_estimated', mixed_column.metadata)
+
+    def test_column_statistics_are_computed_on_access(self) -> None:
+        """Test that column statistics are deferred until first accessed."""
+        dataset = Dataset(data=self.test_df.copy(), metadata={})
+        # pylint: disable=protected-access
+        self.assertTrue(all(col._stats_pending() for col in dataset.columns))
+
+        text_column = dataset.get_column_by_name('text')
+        self.assertIsNotNone(text_column)
+        if text_column:
+            self.assertEqual(text_column.stats['count'], 4)
+            self.assertFalse(text_column._stats_pending())
+
+        # Other columns stay pending
+        numeric_column = dataset.get_column_by_name('numeric')
+        self.assertIsNotNone(numeric_column)
+        if numeric_column:
+            self.assertTrue(numeric_column._stats_pending())
+
+    def test_deferred_statistics_outlive_dataset(self) -> None:
+        """Test that deferred statistics are still computed after the dataset is dropped."""
+        dataset = Dataset(data=self.test_df.copy(), metadata={})
+        text_column = dataset.get_column_by_name('text')
+        numeric_column = dataset.get_column_by_name('numeric')
+        del dataset
+        gc.collect()
+
+        self.assertIsNotNone(text_column)
+        self.assertIsNotNone(numeric_column)
+        if text_column and numeric_column:
+            self.assertEqual(text_column.stats['count'], 4)
+            self.assertEqual(numeric_column.stats['count'], 4)
+            self.assertEqual(numeric_column.stats['max'], 5)
+
+    def test_nullable_column_missing_statistics_are_none(self) -> None:
+        """Test that missing metrics of nullable dtypes are stored as None."""
+        column = Column.from_series('nullable', pd.Series([1, None], dtype='Int64'))
+
+        self.assertEqual(column.stats['min'], 1)
+        self.assertIsNone(column.stats['std'])
+
     def test_to_json_and_from_json(self) -> None:
         """Test serialization and deserialization of Dataset."""
         # Convert to JSON
@@ -277,6 +430,25 @@ class TestDataset(unittest.TestCase):
             self.assertEqual(numeric_column.stats['min'], 1)
             self.assertEqual(numeric_column.stats['max'], 5)
 
+    def test_to_json_optimized_round_trip(self) -> None:
+        """Test that interned type names are restored by from_json."""
+        json_data = self.full_dataset.to_json(optimized=True)
+
+        # Each distinct type name is stored once
+        strings = json_data['_strings']
+        self.assertEqual(len(strings), len(set(strings)))
+        self.assertIsInstance(json_data['columns'][0]['original_type'], int)
+        self.assertIsInstance(json_data['metadata']['column_types']['numeric'], int)
+
+        new_dataset = Dataset.from_json(json_data)
+        self.assertEqual(json_data['data_orient'], 'split')
+        pd.testing.assert_series_equal(new_dataset.data['numeric'], self.full_dataset.data['numeric'])
+        self.assertEqual(new_dataset.metadata['column_types'],
+                         self.full_dataset.metadata['column_types'])
+        self.assertEqual(new_dataset.get_column_types(), self.full_dataset.get_column_types())
+        self.assertEqual([col.data_type for col in new_dataset.columns],
+                         [col.data_type for col in self.full_dataset.columns])
+
 
 if __name__ == '__main__':
     _ = unittest.main()
@@ -141,6 +141,31 @@ class TestDataModels(unittest.TestCase):
         self.assertTrue(project.has_unsaved_changes())
 
 
+    def test_project_version_counter(self):
+        """Test that mutations after mark_as_saved are reported as unsaved changes."""
+        project = Project(
+            name="Test Project",
+            created=datetime.now(),
+            modified=datetime.now(),
+            data_sources=[]
+        )
+        project.mark_as_saved()
+        self.assertFalse(project.has_unsaved_changes())
+        saved_state = project.get_saved_state()
+        self.assertIsNotNone(saved_state)
+        if saved_state:
+            self.assertEqual(saved_state['name'], "Test Project")
+
+        project.rename("Renamed Project")
+        self.assertTrue(project.has_unsaved_changes())
+
+        project.mark_as_saved()
+        self.assertFalse(project.has_unsaved_changes())
+
+        # Timestamps alone are not a change
+        project.modified = datetime.now()
+        self.assertFalse(project.has_unsaved_changes())
+
 # Observer für die Project-Klasse (keine Testklasse)
 class ProjectObserverForTests:
     """Test observer class for Project objects."""
@@ -360,6 +385,83 @@ class TestProjectObservable(unittest.TestCase):
         self.assertEqual(self.observer.last_subject, self.project)
         self.assertEqual(self.observer.last_event, "data_sources_cleared")
 
+    def test_in_place_replacement_is_tracked(self) -> None:
+        """Test that replacing an item in place marks the project as modified."""
+        self.project.add_data_source(self.data_source)
+        self.project.mark_as_saved()
+        self.assertFalse(self.project.has_unsaved_changes())
+        before = self.project.modified
+
+        # Same list, same length
+        self.project.data_sources[0] = self.data_source
+        self.assertTrue(self.project.has_unsaved_changes())
+        # pylint: disable=protected-access
+        self.assertTrue(self.project._collections_modified)  # type: ignore
+        self.assertGreaterEqual(self.project.modified, before)
+
+    def test_reassigned_list_is_tracked(self) -> None:
+        """Test that a reassigned data source list is tracked as well."""
+        self.project.data_sources = []
+        self.project.mark_as_saved()
+
+        self.project.data_sources.append(self.data_source)
+        self.assertTrue(self.project.has_unsaved_changes())
+
+    def test_lookup_by_id_follows_changes(self) -> None:
+        """Test that id lookups see added and removed items."""
+        self.assertIsNone(self.project.get_data_source_by_id(self.data_source.id))
+
+        self.project.add_data_source(self.data_source)
+        self.assertIs(self.project.get_data_source_by_id(self.data_source.id), self.data_source)
+
+        self.data_source.add_visualization(self.visualization)
+        self.assertIs(self.project.get_visualization_by_id(self.visualization.id), self.visualization)
+
+        self.data_source.remove_visualization(self.visualization.id)
+        self.assertIsNone(self.data_source.get_visualization_by_id(self.visualization.id))
+
+        self.project.remove_data_source(self.data_source)
+        self.assertIsNone(self.project.get_data_source_by_id(self.data_source.id))
+
+    def test_data_source_lookup_after_in_place_replacement(self) -> None:
+        """Test that id lookups see a data source replaced in place."""
+        self.project.add_data_source(self.data_source)
+        self.assertIs(self.project.get_data_source_by_id(self.data_source.id), self.data_source)
+
+        replacement = DataSource(
+            name="Replacement",
+            source_type="csv",
+            file_path=Path("/path/to/other.csv"),
+            created_at=self.now
+        )
+        self.project.data_sources[0] = replacement
+        self.assertIsNone(self.project.get_data_source_by_id(self.data_source.id))
+        self.assertIs(self.project.get_data_source_by_id(replacement.id), replacement)
+
+    def test_visualization_lookup_after_remove_and_add(self) -> None:
+        """Test that removing and adding visualizations never serves stale lookups."""
+        visualizations = [Visualization(name=f"Vis {i}", chart_type="bar", config={}) for i in range(3)]
+        for vis in visualizations:
+            self.data_source.add_visualization(vis)
+        self.assertIs(self.data_source.get_visualization_by_id(visualizations[0].id), visualizations[0])
+
+        # Remove and add keep the length while the list object is replaced
+        for _ in range(2):
+            removed = self.data_source.visualizations[0]
+            self.data_source.remove_visualization(removed.id)
+            added = Visualization(name="New", chart_type="line", config={})
+            self.data_source.add_visualization(added)
+
+            self.assertIs(self.data_source.get_visualization_by_id(added.id), added)
+            self.assertIsNone(self.data_source.get_visualization_by_id(removed.id))
+
+        # In-place replacement keeps both the list and its length
+        replacement = Visualization(name="Replacement", chart_type="pie", config={})
+        replaced = self.data_source.visualizations[1]
+        self.data_source.visualizations[1] = replacement
+        self.assertIs(self.data_source.get_visualization_by_id(replacement.id), replacement)
+        self.assertIsNone(self.data_source.get_visualization_by_id(replaced.id))
+
     def test_multiple_observers(self) -> None:
         """Test multiple observers on the same project."""
         # Create a second observer
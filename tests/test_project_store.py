@@ -1,6 +1,7 @@
 """Tests for project store functionality."""
 import unittest
 import tempfile
+import gzip
 import json
 from pathlib import Path
 from datetime import datetime
@@ -11,7 +12,7 @@ from typing import override
 from src.data.models import Project, DataSource, Dataset, Visualization
 from src.data.project_store import ProjectStore
 from src.exceptions import ProjectNotFoundError, ProjectError
-from src.config import PROJECT_FILE_EXTENSION
+from src.config import PROJECT_FILE_EXTENSION, PROJECT_FORMAT_VERSION
 
 class TestProjectStore(unittest.TestCase):
     """Test cases for the ProjectStore class."""
@@ -88,8 +89,8 @@ class TestProjectStore(unittest.TestCase):
         # Verify the file was created
         self.assertTrue(file_path.exists())
 
-        # Verify file content is JSON
-        with open(file_path, 'r') as f:
+        # Verify file content is gzip-compressed JSON
+        with gzip.open(file_path, 'rt') as f:
             project_data = json.load(f)
             self.assertEqual(project_data["name"], self.test_project.name)
 
@@ -118,6 +119,53 @@ class TestProjectStore(unittest.TestCase):
         self.assertEqual(loaded_project.data_sources[0].visualizations[0].name,
                         self.test_project.data_sources[0].visualizations[0].name)
 
+    @mock.patch('src.data.project_store.orjson', None)
+    def test_save_and_load_without_orjson(self):
+        """Test that projects round-trip through the standard json fallback."""
+        file_path = Path(self.temp_dir.name) / f"test_project{PROJECT_FILE_EXTENSION}"
+
+        ProjectStore.save(self.test_project, file_path)
+        loaded_project = ProjectStore.load(file_path)
+
+        self.assertEqual(loaded_project.name, self.test_project.name)
+        self.assertEqual(len(loaded_project.data_sources), 1)
+
+    def test_save_multiple_and_no_data_sources(self):
+        """Test that the streamed project file stays valid JSON for any number of data sources."""
+        file_path = Path(self.temp_dir.name) / f"test_project{PROJECT_FILE_EXTENSION}"
+        second = DataSource(name="Second Source", source_type="csv", file_path=Path("second.csv"))
+        self.test_project.add_data_source(second)
+
+        ProjectStore.save(self.test_project, file_path)
+        with gzip.open(file_path, 'rt') as f:
+            saved_data = json.load(f)
+        self.assertEqual([ds["name"] for ds in saved_data["data_sources"]],
+                         ["Test Source", "Second Source"])
+        self.assertEqual(list(Path(self.temp_dir.name).iterdir()), [file_path])
+
+        self.test_project.data_sources.clear()
+        ProjectStore.save(self.test_project, file_path)
+        self.assertEqual(ProjectStore.load(file_path).data_sources, [])
+
+    def test_format_version_and_legacy_load(self):
+        """Test that saved files are versioned and unversioned legacy files are still converted."""
+        file_path = Path(self.temp_dir.name) / f"test_project{PROJECT_FILE_EXTENSION}"
+        ProjectStore.save(self.test_project, file_path)
+        with gzip.open(file_path, 'rt') as f:
+            saved_data = json.load(f)
+        self.assertEqual(saved_data["format_version"], PROJECT_FORMAT_VERSION)
+
+        # A legacy file is uncompressed and keeps visualizations at the top level
+        legacy_visualizations = saved_data["data_sources"][0].pop("visualizations")
+        del saved_data["format_version"]
+        saved_data["visualizations"] = legacy_visualizations
+        with open(file_path, 'w') as f:
+            json.dump(saved_data, f)
+
+        loaded_project = ProjectStore.load(file_path)
+        self.assertEqual([vis.name for vis in loaded_project.data_sources[0].visualizations],
+                         ["Test Visualization"])
+
     def test_load_nonexistent_project(self):
         """Test loading a project that does not exist."""
         nonexistent_path = Path(self.temp_dir.name) / "nonexistent_project.dinsp"
@@ -187,6 +235,13 @@ class TestProjectStore(unittest.TestCase):
         # After saving, there should be no unsaved changes
         self.assertFalse(self.test_project.has_unsaved_changes())
 
+        # The project no longer reports that it was never saved
+        saved_state = self.test_project.get_saved_state()
+        self.assertIsNotNone(saved_state)
+        if saved_state:
+            self.assertEqual(saved_state['id'], self.test_project.id)
+            self.assertEqual(len(saved_state['data_sources']), len(self.test_project.data_sources))
+
         # Modify the project
         self.test_project.name = "Modified Project"
 
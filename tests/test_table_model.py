@@ -0,0 +1,89 @@
+"""Tests for the DataFrame table model."""
+import unittest
+from typing import override
+import pandas as pd
+from PyQt6.QtCore import Qt
+
+from src.gui.table_model import DataFrameTableModel, MissingValueTableModel
+
+
+class TestDataFrameTableModel(unittest.TestCase):
+    """Test cases for the DataFrameTableModel class."""
+
+    @override
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.model = DataFrameTableModel()
+        self.model.set_dataframe(pd.DataFrame({'A': [1, 2, 3], 'B': ['x', None, 'z']}))
+
+    def test_dimensions_and_headers(self) -> None:
+        """Test that rows, columns and headers follow the DataFrame."""
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertEqual(self.model.columnCount(), 2)
+        self.assertEqual(self.model.headerData(1, Qt.Orientation.Horizontal), 'B')
+        self.assertEqual(self.model.headerData(0, Qt.Orientation.Vertical), '1')
+
+    def test_cell_text(self) -> None:
+        """Test that cells are shown as their string representation."""
+        self.assertEqual(self.model.data(self.model.index(2, 0)), '3')
+        self.assertEqual(self.model.data(self.model.index(1, 1)), 'None')
+        self.assertIsNone(self.model.data(self.model.index(0, 0), Qt.ItemDataRole.EditRole))
+
+    def test_cell_text_matches_pandas_scalars(self) -> None:
+        """Test that cells of all column kinds are shown like the DataFrame's scalars."""
+        df = pd.DataFrame({
+            'float': [1.5, None],
+            'date': pd.to_datetime(['2021-01-01', None]),
+            'duration': pd.to_timedelta([1, None], unit='D'),
+            'category': pd.Categorical(['x', None]),
+            'nullable': pd.array([1, None], dtype='Int64'),
+        })
+        self.model.set_dataframe(df)
+
+        for row in range(len(df)):
+            for column in range(len(df.columns)):
+                self.assertEqual(self.model.data(self.model.index(row, column)), str(df.iat[row, column]))
+
+    def test_set_dataframe_resets_model(self) -> None:
+        """Test that replacing the DataFrame notifies attached views."""
+        resets: list[bool] = []
+        _ = self.model.modelReset.connect(lambda: resets.append(True))
+
+        self.model.set_dataframe(pd.DataFrame({'C': [1.5]}))
+
+        self.assertEqual(resets, [True])
+        self.assertEqual(self.model.rowCount(), 1)
+        self.assertEqual(self.model.data(self.model.index(0, 0)), '1.5')
+
+
+class TestMissingValueTableModel(unittest.TestCase):
+    """Test cases for the MissingValueTableModel class."""
+
+    @override
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.model = MissingValueTableModel()
+        self.model.set_dataframe(pd.DataFrame({'A': [1.0, None], 'B': ['x', 'y']}), ['A [f]', 'B [s]'])
+
+    def test_missing_cells_are_colored(self) -> None:
+        """Test that only missing cells get background and foreground colors."""
+        missing = self.model.index(1, 0)
+        present = self.model.index(0, 0)
+
+        self.assertEqual(self.model.data(missing), 'nan')
+        self.assertIsNotNone(self.model.data(missing, Qt.ItemDataRole.BackgroundRole))
+        self.assertIsNotNone(self.model.data(missing, Qt.ItemDataRole.ForegroundRole))
+        self.assertIsNone(self.model.data(present, Qt.ItemDataRole.BackgroundRole))
+        self.assertIsNone(self.model.data(self.model.index(1, 1), Qt.ItemDataRole.BackgroundRole))
+
+    def test_column_labels(self) -> None:
+        """Test that custom labels replace the column names until the next reset."""
+        self.assertEqual(self.model.headerData(1, Qt.Orientation.Horizontal), 'B [s]')
+        self.assertEqual(self.model.headerData(1, Qt.Orientation.Vertical), '2')
+
+        self.model.set_dataframe(pd.DataFrame({'C': [1]}))
+        self.assertEqual(self.model.headerData(0, Qt.Orientation.Horizontal), 'C')
+
+
+if __name__ == '__main__':
+    _ = unittest.main()